@@ -12,13 +12,15 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-# Add monte_carlo to path
+# Add monte_carlo and src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import numpy as np
 from google.cloud import bigtable
 
 from monte_carlo.simulation import SimulationConfig, run_simulation
+from poly.storage.bigtable import decode_orderbook
 
 
 @dataclass
@@ -55,7 +57,7 @@ def fetch_snapshots() -> list[Snapshot]:
 
         # Parse orderbook for yes_mid
         yes_mid = 0.5
-        ob_str = get(b"orderbook")
+        ob_str = decode_orderbook(cells[b"orderbook"][0].value) if b"orderbook" in cells else ""
         if ob_str:
             try:
                 ob = json.loads(ob_str)
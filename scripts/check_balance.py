@@ -28,6 +28,16 @@ sys.path.insert(0, "src")
 
 import requests
 
+# orjson is optional; fall back to stdlib json
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
 from poly import PolymarketConfig, PolymarketAPI
 
 # Contract addresses (Polygon mainnet)
@@ -37,6 +47,10 @@ EXCHANGE_ADDRESS = "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E"  # Polymarket CT
 
 POLYGON_RPC = "https://polygon-rpc.com"
 
+# Section separators
+SEP_HEAVY = "=" * 60
+SEP_LIGHT = "-" * 60
+
 
 def eth_call(to: str, data: str) -> str:
     """Make an eth_call to Polygon RPC."""
@@ -46,7 +60,7 @@ def eth_call(to: str, data: str) -> str:
         "params": [{"to": to, "data": data}, "latest"],
         "id": 1,
     })
-    result = resp.json()
+    result = _json_loads(resp.content)
     if "error" in result:
         raise Exception(result["error"]["message"])
     return result["result"]
@@ -60,7 +74,7 @@ def get_matic_balance(wallet: str) -> float:
         "params": [wallet, "latest"],
         "id": 1,
     })
-    result = resp.json()
+    result = _json_loads(resp.content)
     if "error" in result:
         raise Exception(result["error"]["message"])
     return int(result["result"], 16) / 1e18
@@ -87,6 +101,11 @@ def get_erc20_allowance(token: str, wallet: str, spender: str, decimals: int = 6
     return raw / (10 ** decimals)
 
 
+def print_section(title: str) -> None:
+    """Print a section header framed by light separators."""
+    sys.stdout.write(f"\n{SEP_LIGHT}\n{title}\n{SEP_LIGHT}\n")
+
+
 def format_amount(amount: float, symbol: str = "$") -> str:
     """Format amount for display."""
     if amount == float("inf"):
@@ -120,39 +139,42 @@ def fetch_activity(wallet: str, limit: int = 10) -> list[dict]:
         url = f"https://data-api.polymarket.com/activity?user={wallet}&limit={limit}"
         resp = requests.get(url)
         if resp.status_code == 200:
-            return resp.json()
+            return _json_loads(resp.content)
     except Exception:
         pass
     return []
 
 
+def fetch_open_orders(config: PolymarketConfig) -> list:
+    """Fetch open orders (requires py-clob-client with auth)."""
+    if not config.has_trading_credentials:
+        return []
+    try:
+        from poly import LocalSigner
+        signer = LocalSigner(
+            private_key=config.private_key,
+            chain_id=config.chain_id,
+        )
+        client = signer._get_clob_client()
+        return client.get_orders()
+    except Exception:
+        # Silently ignore - user may not have any orders
+        return []
+
+
 async def fetch_positions_and_orders(config: PolymarketConfig):
-    """Fetch positions and open orders."""
-    positions = []
-    open_orders = []
+    """Fetch positions and open orders concurrently."""
+    # The CLOB client is synchronous, so run it in a thread alongside positions
+    orders_task = asyncio.create_task(asyncio.to_thread(fetch_open_orders, config))
 
+    positions = []
     async with PolymarketAPI(config) as api:
-        # Fetch positions
         try:
             positions = await api.get_positions(limit=50)
         except Exception as e:
             print(f"  [WARN] Could not fetch positions: {e}")
 
-    # Fetch open orders (requires py-clob-client with auth)
-    if config.has_trading_credentials:
-        try:
-            from poly import LocalSigner
-            signer = LocalSigner(
-                private_key=config.private_key,
-                chain_id=config.chain_id,
-            )
-            client = signer._get_clob_client()
-            open_orders = client.get_orders()
-        except Exception as e:
-            # This is expected if no orders exist
-            if "not found" not in str(e).lower():
-                pass  # Silently ignore - user may not have any orders
-
+    open_orders = await orders_task
     return positions, open_orders
 
 
@@ -174,9 +196,9 @@ def main():
     )
     args = parser.parse_args()
 
-    print("=" * 60)
+    print(SEP_HEAVY)
     print("POLYMARKET WALLET STATUS")
-    print("=" * 60)
+    print(SEP_HEAVY)
 
     # Get wallet address and config
     config = None
@@ -198,9 +220,7 @@ def main():
             print("Use --wallet flag or set POLYMARKET_WALLET_ADDRESS")
             return 1
 
-    print("\n" + "-" * 60)
-    print("BALANCES")
-    print("-" * 60)
+    print_section("BALANCES")
 
     try:
         # MATIC balance
@@ -223,9 +243,7 @@ def main():
         print(f"[ERROR] Failed to fetch balances: {e}")
         return 1
 
-    print("\n" + "-" * 60)
-    print("ALLOWANCES (Polymarket Exchange)")
-    print("-" * 60)
+    print_section("ALLOWANCES (Polymarket Exchange)")
 
     try:
         # USDC.e allowance
@@ -246,9 +264,7 @@ def main():
         return 1
 
     # Fetch positions and orders
-    print("\n" + "-" * 60)
-    print("POSITIONS & ORDERS")
-    print("-" * 60)
+    print_section("POSITIONS & ORDERS")
 
     positions, open_orders = asyncio.run(
         fetch_positions_and_orders(config)
@@ -298,9 +314,7 @@ def main():
         print("\nNo open orders")
 
     # Fetch and display activity history
-    print("\n" + "-" * 60)
-    print(f"ACTIVITY HISTORY (last {args.trades})")
-    print("-" * 60)
+    print_section(f"ACTIVITY HISTORY (last {args.trades})")
 
     activity = fetch_activity(wallet, limit=args.trades)
 
@@ -327,17 +341,13 @@ def main():
         print("No activity history")
 
     # Contract addresses
-    print("\n" + "-" * 60)
-    print("CONTRACT ADDRESSES")
-    print("-" * 60)
+    print_section("CONTRACT ADDRESSES")
     print(f"USDC.e:   {USDC_E_ADDRESS}")
     print(f"USDC:     {USDC_NATIVE_ADDRESS}")
     print(f"Exchange: {EXCHANGE_ADDRESS}")
 
     # Trading readiness check
-    print("\n" + "-" * 60)
-    print("TRADING READINESS")
-    print("-" * 60)
+    print_section("TRADING READINESS")
 
     ready = True
     if matic < 0.01:
@@ -354,8 +364,9 @@ def main():
         ready = False
 
     if ready:
+        tradeable = usdc_e if allowance == float("inf") else min(usdc_e, allowance)
         print("✓ Ready to trade on Polymarket!")
-        print(f"  Available: {format_amount(min(usdc_e, allowance if allowance != float('inf') else usdc_e))}")
+        print(f"  Available: {format_amount(tradeable)}")
 
     print()
     return 0
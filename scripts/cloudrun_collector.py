@@ -11,23 +11,29 @@ Stores: timestamp, market_id, price, orderbook
 
 import asyncio
 import os
+import signal
+import socket
 import sys
 import time as time_module
-import threading
-from dataclasses import dataclass
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from datetime import datetime, timezone
-from decimal import Decimal
 from typing import Optional
 
 import aiohttp
+from aiohttp import web
+
+# uvloop is optional (faster event loop on Linux)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from poly.storage.db_writer import get_db_writer
-from poly.api.binance import get_btc_price, get_eth_price
+from poly.api.binance import BTCUSDT, ETHUSDT, get_prices
 from poly.storage.bigtable import (
     TABLE_BTC_15M, TABLE_BTC_1H, TABLE_BTC_4H, TABLE_BTC_D1,
     TABLE_ETH_15M, TABLE_ETH_1H, TABLE_ETH_4H,
@@ -43,11 +49,48 @@ from poly.market_snapshot import (
     fetch_orderbook,
 )
 
-# Timeout for API calls (seconds)
+# Timeouts for each API request (seconds)
 FETCH_TIMEOUT = 5.0
+CONNECT_TIMEOUT = 1.0
+
+# Price polling runs on its own cadence; cached prices expire after max age
+PRICE_INTERVAL = float(os.getenv("PRICE_INTERVAL", "1"))
+PRICE_MAX_AGE = 30.0
+PRICE_SYMBOLS = {"BTC": BTCUSDT, "ETH": ETHUSDT}
+
+# Startup wait for the first price before each retry is logged (seconds)
+FIRST_PRICE_TIMEOUT = 30.0
+
+# Per-tick status line (follows the "Loop N: fetching..." prefix)
+TICK_LOG_FMT = "(%.1fs) BTC:%s [%s] | ETH:%s [%s]\n"
+
+# Healthy while at least HEALTH_MIN_SUCCESSES of the last HEALTH_WINDOW ticks succeeded
+HEALTH_WINDOW = 20
+HEALTH_MIN_SUCCESSES = 5
+
+# Snapshot writes are queued (bounded) and flushed in batches by a writer task
+WRITE_QUEUE_SIZE = 256
+WRITE_BATCH_SIZE = 32
+
+# On shutdown, wait this long for queued snapshots to be written (seconds)
+SHUTDOWN_DRAIN_TIMEOUT = 10.0
+
+# DNS cache TTL for the shared connector (seconds)
+DNS_CACHE_TTL = 600
+
+# Idle keep-alive for pooled connections (seconds, must exceed COLLECT_INTERVAL)
+KEEPALIVE_TIMEOUT = 75.0
 
+# Short horizon labels used in the tick log
+HORIZON_STR = {
+    MarketHorizon.M15: "15m",
+    MarketHorizon.H1: "1h",
+    MarketHorizon.H4: "4h",
+    MarketHorizon.D1: "d1",
+}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MarketType:
     """Configuration for a market type."""
 
@@ -55,26 +98,37 @@ class MarketType:
     table_name: str
     asset: Asset
     horizon: MarketHorizon
+    horizon_str: str = field(init=False)  # Short horizon string (15m, 1h, 4h, d1)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields must bypass __setattr__
+        object.__setattr__(self, "horizon_str", HORIZON_STR[self.horizon])
 
-    async def fetch_snapshot(self, price: Decimal) -> Optional[MarketSnapshot]:
+    async def fetch_snapshot(
+        self,
+        session: aiohttp.ClientSession,
+        price: float,
+    ) -> Optional[MarketSnapshot]:
         """Fetch snapshot for this market type.
 
         Args:
+            session: Shared aiohttp session.
             price: Current asset price (BTC or ETH).
 
         Returns:
             MarketSnapshot or None if not available.
         """
         try:
-            prediction = await fetch_current_prediction(self.asset, self.horizon)
+            prediction = await fetch_current_prediction(
+                self.asset, self.horizon, session=session
+            )
             if not prediction:
                 return None
 
-            async with aiohttp.ClientSession() as session:
-                (yes_bids, yes_asks), (no_bids, no_asks) = await asyncio.gather(
-                    fetch_orderbook(session, prediction.up_token_id),
-                    fetch_orderbook(session, prediction.down_token_id),
-                )
+            (yes_bids, yes_asks), (no_bids, no_asks) = await asyncio.gather(
+                fetch_orderbook(session, prediction.up_token_id),
+                fetch_orderbook(session, prediction.down_token_id),
+            )
 
             return MarketSnapshot(
                 timestamp=time_module.time(),
@@ -89,26 +143,21 @@ class MarketType:
             print(f"Error fetching {self.label} snapshot: {e}")
             return None
 
-    @property
-    def horizon_str(self) -> str:
-        """Short horizon string (15m, 1h, 4h, d1)."""
-        return {
-            MarketHorizon.M15: "15m",
-            MarketHorizon.H1: "1h",
-            MarketHorizon.H4: "4h",
-            MarketHorizon.D1: "d1",
-        }[self.horizon]
-
     def process_snapshot(
         self,
         snapshot: Optional[MarketSnapshot],
-        writer,
+        write_queue: asyncio.Queue,
     ) -> tuple[Optional[str], Optional[str]]:
-        """Write snapshot and return (result_str, market_id)."""
+        """Queue snapshot for writing and return (result_str, market_id)."""
+        global write_failures
         if not snapshot:
             return None, None
 
-        writer.write_snapshot_from_obj(snapshot, table_name=self.table_name)
+        try:
+            write_queue.put_nowait((snapshot, self.table_name))
+        except asyncio.QueueFull:
+            write_failures += 1
+            print(f"Write queue full, dropping {self.label} snapshot", flush=True)
 
         if snapshot.yes_mid:
             mid = float(snapshot.yes_mid) * 100
@@ -136,77 +185,209 @@ ETH_MARKETS = [
 ALL_MARKETS = BTC_MARKETS + ETH_MARKETS
 
 
-# Collector state
-collector_healthy = True
-last_success_time = 0
-latest_prices: dict[str, Optional[Decimal]] = {"BTC": None, "ETH": None}
+# Collector state (unhealthy until the first price arrives)
+collector_healthy = False
+last_success_time = 0  # wall clock of the last successful snapshot write
+write_failures = 0  # failed or dropped snapshot writes since the last tick
+latest_prices: dict[str, Optional[float]] = {"BTC": None, "ETH": None}
+price_updated_at: dict[str, float] = {"BTC": float("-inf"), "ETH": float("-inf")}  # monotonic
 latest_markets: dict[str, Optional[str]] = {}
 
 
-class HealthHandler(BaseHTTPRequestHandler):
-    """Simple health check handler."""
-
-    def do_GET(self):
-        if self.path == "/" or self.path == "/health":
-            if collector_healthy:
-                self.send_response(200)
-                self.send_header("Content-Type", "text/plain")
-                self.end_headers()
-                btc = latest_prices.get("BTC")
-                eth = latest_prices.get("ETH")
-                btc_str = f"${btc:,.0f}" if btc else "N/A"
-                eth_str = f"${eth:,.0f}" if eth else "N/A"
-                self.wfile.write(f"OK | BTC:{btc_str} | ETH:{eth_str}".encode())
-            else:
-                self.send_response(503)
-                self.send_header("Content-Type", "text/plain")
-                self.end_headers()
-                self.wfile.write(b"Collector unhealthy")
-        else:
-            self.send_response(404)
-            self.end_headers()
+async def health_handler(request: web.Request) -> web.Response:
+    """Health check endpoint (runs on the collector's event loop)."""
+    if not collector_healthy:
+        return web.Response(status=503, text="Collector unhealthy")
+
+    btc = latest_prices.get("BTC")
+    eth = latest_prices.get("ETH")
+    btc_str = f"${btc:,.0f}" if btc else "N/A"
+    eth_str = f"${eth:,.0f}" if eth else "N/A"
+    return web.Response(text=f"OK | BTC:{btc_str} | ETH:{eth_str}")
 
-    def log_message(self, format, *args):
-        pass
 
+async def start_health_server(port: int) -> web.AppRunner:
+    """Start the HTTP health check server on the running event loop."""
+    app = web.Application()
+    app.router.add_get("/", health_handler)
+    app.router.add_get("/health", health_handler)
 
-def run_health_server(port: int):
-    """Run HTTP health check server."""
-    server = HTTPServer(("0.0.0.0", port), HealthHandler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "0.0.0.0", port, reuse_port=True, backlog=2048)
+    await site.start()
     print(f"Health server listening on port {port}")
-    server.serve_forever()
+    return runner
+
+
+def _ts() -> str:
+    """Current UTC time as HH:MM:SS for log lines."""
+    return time_module.strftime("%H:%M:%S", time_module.gmtime())
+
+
+def _fmt_price(price: Optional[float]) -> str:
+    """Format a price as whole dollars, or ERR if unavailable."""
+    return "$" + format(price, ",.0f") if price else "ERR"
+
+
+def current_price(asset: str) -> Optional[float]:
+    """Latest cached price for an asset, or None if missing or stale."""
+    if time_module.monotonic() - price_updated_at[asset] > PRICE_MAX_AGE:
+        return None
+    return latest_prices[asset]
+
+
+async def price_loop(
+    session: aiohttp.ClientSession,
+    interval: float,
+    first_price: asyncio.Event,
+):
+    """Poll BTC and ETH prices into latest_prices independently of markets."""
+    while True:
+        start_time = time_module.monotonic()
+
+        # One batched Binance request for all assets
+        try:
+            prices = await get_prices(*PRICE_SYMBOLS.values(), session=session)
+        except Exception:
+            prices = {}
+
+        for asset, symbol in PRICE_SYMBOLS.items():
+            price = prices.get(symbol)
+            if price:
+                # Convert once; the collector only needs float precision
+                latest_prices[asset] = float(price)
+                price_updated_at[asset] = start_time
+                first_price.set()
+
+        elapsed = time_module.monotonic() - start_time
+        await asyncio.sleep(max(0.1, interval - elapsed))
+
+
+def write_snapshots(writer, batch: list[tuple[MarketSnapshot, str]]):
+    """Write a batch of (snapshot, table_name) pairs, batched if supported."""
+    if hasattr(writer, "write_snapshots_from_objs"):
+        writer.write_snapshots_from_objs(batch)
+    else:
+        for snapshot, table_name in batch:
+            writer.write_snapshot_from_obj(snapshot, table_name=table_name)
+
+
+async def writer_loop(writer, write_queue: asyncio.Queue):
+    """Drain queued snapshots and write them off the event loop.
+
+    Successful writes advance last_success_time; failed batches are counted
+    in write_failures, which the collect loop folds into the health window.
+    """
+    global last_success_time, write_failures
+    while True:
+        batch = [await write_queue.get()]
+        while len(batch) < WRITE_BATCH_SIZE and not write_queue.empty():
+            batch.append(write_queue.get_nowait())
+
+        try:
+            await asyncio.to_thread(write_snapshots, writer, batch)
+            last_success_time = time_module.time()
+        except Exception as e:
+            write_failures += 1
+            print(f"Error writing {len(batch)} snapshots: {type(e).__name__}: {e}", flush=True)
+        finally:
+            for _ in batch:
+                write_queue.task_done()
+
+
+def make_connector(interval: float) -> aiohttp.TCPConnector:
+    """Create the shared connector for the collector's few fixed hosts.
+
+    Uses aiodns (if installed) with a long DNS cache and IPv4 only, so
+    lookups stay hot across the 24/7 loop without a threadpool hop.
+    """
+    try:
+        resolver = aiohttp.AsyncResolver()
+    except RuntimeError:
+        # aiodns not installed, use aiohttp's default threaded resolver
+        resolver = None
+
+    return aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=16,
+        keepalive_timeout=max(KEEPALIVE_TIMEOUT, interval * 2),
+        resolver=resolver,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        family=socket.AF_INET,
+        enable_cleanup_closed=True,
+    )
 
 
 async def collect_asset_markets(
+    session: aiohttp.ClientSession,
     markets: list[MarketType],
-    price: Decimal,
-    writer,
+    price: float,
+    write_queue: asyncio.Queue,
 ) -> list[str]:
     """Collect all markets for an asset concurrently.
 
     Returns list of result strings.
     """
-    # Fetch all snapshots concurrently
-    snapshots = await asyncio.gather(
-        *[m.fetch_snapshot(price) for m in markets],
-        return_exceptions=True
+    # Fetch all snapshots concurrently (fetch_snapshot never raises)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(m.fetch_snapshot(session, price)) for m in markets]
+
+    processed = [
+        (market.label, *market.process_snapshot(task.result(), write_queue))
+        for market, task in zip(markets, tasks)
+    ]
+    latest_markets.update(
+        {label: market_id for label, result, market_id in processed if result}
     )
+    return [result for _, result, _ in processed if result]
+
+
+async def shutdown_background_tasks(
+    price_task: Optional[asyncio.Task],
+    writer_task: asyncio.Task,
+    write_queue: asyncio.Queue,
+):
+    """Stop price polling, flush queued snapshots, then stop the writer."""
+    if price_task is not None:
+        price_task.cancel()
+
+    pending = write_queue.qsize()
+    if pending:
+        print(f"Flushing {pending} queued snapshot(s)...", flush=True)
+    try:
+        await asyncio.wait_for(write_queue.join(), SHUTDOWN_DRAIN_TIMEOUT)
+    except asyncio.TimeoutError:
+        print(f"Gave up flushing after {SHUTDOWN_DRAIN_TIMEOUT:.0f}s, "
+              f"{write_queue.qsize()} snapshot(s) not written", flush=True)
+
+    writer_task.cancel()
+    tasks = [t for t in (price_task, writer_task) if t is not None]
+    await asyncio.gather(*tasks, return_exceptions=True)
 
-    results = []
-    for market, snapshot in zip(markets, snapshots):
-        if isinstance(snapshot, Exception):
-            continue
-        result, market_id = market.process_snapshot(snapshot, writer)
-        if result:
-            results.append(result)
-            latest_markets[market.label] = market_id
 
-    return results
+async def run_collector(interval: float, port: int):
+    """Run the health server and the snapshot collector loop."""
+    health_runner = await start_health_server(port)
+
+    # Cloud Run stops instances with SIGTERM; cancel like Ctrl-C so the
+    # collect loop can flush queued snapshots before exiting
+    collector_task = asyncio.current_task()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, collector_task.cancel)
+    except NotImplementedError:
+        pass
+
+    try:
+        await collect_loop(interval)
+    finally:
+        await health_runner.cleanup()
 
 
-async def run_collector(interval: float):
+async def collect_loop(interval: float):
     """Run the snapshot collector loop."""
-    global collector_healthy, last_success_time, latest_prices
+    global collector_healthy, write_failures
 
     backend = os.getenv("DB_BACKEND", "bigtable")
     project_id = os.getenv("BIGTABLE_PROJECT_ID", "")
@@ -217,7 +398,9 @@ async def run_collector(interval: float):
         print(f"  Project: {project_id}")
         print(f"  Instance: {instance_id}")
 
-    writer = get_db_writer(
+    # Writer setup talks to Bigtable synchronously; keep it off the event loop
+    writer = await asyncio.to_thread(
+        get_db_writer,
         backend=backend,
         project_id=project_id,
         instance_id=instance_id,
@@ -225,106 +408,121 @@ async def run_collector(interval: float):
 
     if hasattr(writer, 'ensure_tables'):
         try:
-            writer.ensure_tables()
+            await asyncio.to_thread(writer.ensure_tables)
             print("Tables verified/created")
         except Exception as e:
             print(f"Warning: Could not verify tables: {e}")
 
-    error_count = 0
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+    writer_task = asyncio.create_task(writer_loop(writer, write_queue))
 
-    print(f"Collection loop starting (timeout: {FETCH_TIMEOUT}s)")
+    recent_ticks: deque[bool] = deque(maxlen=HEALTH_WINDOW)
+
+    print(f"Collection loop starting (per-request timeout: {FETCH_TIMEOUT}s)")
     print(f"BTC markets: {', '.join(m.label for m in BTC_MARKETS)}")
     print(f"ETH markets: {', '.join(m.label for m in ETH_MARKETS)}")
     sys.stdout.flush()
 
-    loop_count = 0
-    while True:
-        loop_count += 1
-        start_time = time_module.time()
-        timestamp = datetime.now(timezone.utc).strftime('%H:%M:%S')
-        print(f"[{timestamp}] Loop {loop_count}: fetching...", end=" ", flush=True)
-
-        try:
-            # Fetch BTC and ETH prices concurrently (with individual error handling)
-            btc_price_result, eth_price_result = await asyncio.gather(
-                get_btc_price(),
-                get_eth_price(),
-                return_exceptions=True,
-            )
-
-            btc_price = btc_price_result if not isinstance(btc_price_result, Exception) else None
-            eth_price = eth_price_result if not isinstance(eth_price_result, Exception) else None
-
-            if btc_price:
-                latest_prices["BTC"] = btc_price
-            if eth_price:
-                latest_prices["ETH"] = eth_price
-
-            # Collect BTC and ETH markets concurrently (independent of each other)
-            btc_task = collect_asset_markets(BTC_MARKETS, btc_price, writer) if btc_price else None
-            eth_task = collect_asset_markets(ETH_MARKETS, eth_price, writer) if eth_price else None
+    # One pooled session for the lifetime of the collector
+    connector = make_connector(interval)
+    # Per-request timeouts: a slow leg fails alone instead of the whole tick
+    timeout = aiohttp.ClientTimeout(
+        total=FETCH_TIMEOUT,
+        connect=CONNECT_TIMEOUT,
+        sock_read=FETCH_TIMEOUT - CONNECT_TIMEOUT,
+    )
 
-            tasks = [t for t in [btc_task, eth_task] if t is not None]
-            if tasks:
-                results = await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=FETCH_TIMEOUT,
+    price_task: Optional[asyncio.Task] = None
+    try:
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            # Prices are polled in the background; wait for the first one
+            first_price = asyncio.Event()
+            price_task = asyncio.create_task(price_loop(session, PRICE_INTERVAL, first_price))
+            print(f"Price polling every {PRICE_INTERVAL}s, waiting for first price...", flush=True)
+            attempt = 0
+            while not first_price.is_set():
+                attempt += 1
+                try:
+                    await asyncio.wait_for(first_price.wait(), FIRST_PRICE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    print(f"[{_ts()}] No price after {attempt * FIRST_PRICE_TIMEOUT:.0f}s "
+                          f"(attempt {attempt}), collector unhealthy; still waiting...", flush=True)
+            collector_healthy = True
+            print(f"[{_ts()}] First price received, collector healthy", flush=True)
+
+            loop_count = 0
+            while True:
+                loop_count += 1
+                start_time = time_module.monotonic()
+                timestamp = _ts()
+                print(f"[{timestamp}] Loop {loop_count}: fetching...", end=" ", flush=True)
+
+                try:
+                    # Use the latest prices from the background price poller
+                    btc_price = current_price("BTC")
+                    eth_price = current_price("ETH")
+
+                    # Collect BTC and ETH markets concurrently (independent of each other)
+                    # (each request is bounded by the session's per-request timeout)
+                    btc_task = eth_task = None
+                    async with asyncio.TaskGroup() as tg:
+                        if btc_price:
+                            btc_task = tg.create_task(
+                                collect_asset_markets(session, BTC_MARKETS, btc_price, write_queue)
+                            )
+                        if eth_price:
+                            eth_task = tg.create_task(
+                                collect_asset_markets(session, ETH_MARKETS, eth_price, write_queue)
+                            )
+
+                    btc_results = btc_task.result() if btc_task else []
+                    eth_results = eth_task.result() if eth_task else []
+
+                    sys.stdout.write(TICK_LOG_FMT % (
+                        time_module.monotonic() - start_time,
+                        _fmt_price(btc_price),
+                        " ".join(btc_results) or "none",
+                        _fmt_price(eth_price),
+                        " ".join(eth_results) or "none",
+                    ))
+                    sys.stdout.flush()
+
+                    # A stale or missing price counts as a failed tick, so a
+                    # price outage shows up in the health window
+                    tick_ok = (
+                        btc_price is not None
+                        and eth_price is not None
+                        and bool(btc_results or eth_results)
+                    )
+                    # Failed or dropped writes since the last tick fail it too
+                    if write_failures:
+                        print(f"[{timestamp}] {write_failures} snapshot write(s) failed "
+                              "since last tick", flush=True)
+                        tick_ok = False
+                        write_failures = 0
+
+                except Exception as e:
+                    tick_ok = False
+                    print(f"ERROR: {type(e).__name__}: {e}", flush=True)
+
+                # Health reflects the last HEALTH_WINDOW ticks (judged once full)
+                recent_ticks.append(tick_ok)
+                was_healthy = collector_healthy
+                collector_healthy = (
+                    len(recent_ticks) < HEALTH_WINDOW
+                    or sum(recent_ticks) >= HEALTH_MIN_SUCCESSES
                 )
-                # Map results back
-                result_idx = 0
-                btc_results = []
-                eth_results = []
-                if btc_task:
-                    r = results[result_idx]
-                    btc_results = r if not isinstance(r, Exception) else []
-                    result_idx += 1
-                if eth_task:
-                    r = results[result_idx]
-                    eth_results = r if not isinstance(r, Exception) else []
-            else:
-                btc_results = []
-                eth_results = []
-
-            # Build output
-            elapsed = time_module.time() - start_time
-            parts = [f"({elapsed:.1f}s)"]
-
-            if btc_price:
-                btc_str = f"${float(btc_price):,.0f}"
-                btc_markets = ' '.join(btc_results) if btc_results else "none"
-                parts.append(f"BTC:{btc_str} [{btc_markets}]")
-            else:
-                parts.append("BTC:ERR")
-
-            if eth_price:
-                eth_str = f"${float(eth_price):,.0f}"
-                eth_markets = ' '.join(eth_results) if eth_results else "none"
-                parts.append(f"ETH:{eth_str} [{eth_markets}]")
-            else:
-                parts.append("ETH:ERR")
-
-            print(" | ".join(parts), flush=True)
-
-            if btc_results or eth_results:
-                error_count = 0
-                last_success_time = time_module.time()
-                collector_healthy = True
-
-        except asyncio.TimeoutError:
-            print(f"SKIP (timeout {FETCH_TIMEOUT}s)", flush=True)
-
-        except Exception as e:
-            error_count += 1
-            print(f"ERROR: {type(e).__name__}: {e}", flush=True)
-
-        if error_count >= 10:
-            collector_healthy = False
-            if error_count == 10:
-                print(f"[{timestamp}] Marking collector unhealthy after {error_count} consecutive errors")
+                if was_healthy and not collector_healthy:
+                    print(f"[{timestamp}] Marking collector unhealthy: "
+                          f"{sum(recent_ticks)}/{HEALTH_WINDOW} recent ticks succeeded")
+                elif collector_healthy and not was_healthy:
+                    print(f"[{timestamp}] Collector healthy again")
 
-        query_time = time_module.time() - start_time
-        sleep_time = max(0.1, interval - query_time)
-        await asyncio.sleep(sleep_time)
+                query_time = time_module.monotonic() - start_time
+                sleep_time = max(0.1, interval - query_time)
+                await asyncio.sleep(sleep_time)
+    finally:
+        await shutdown_background_tasks(price_task, writer_task, write_queue)
 
 
 def main():
@@ -336,17 +534,20 @@ def main():
     print("=" * 60)
     print(f"Health port: {port}")
     print(f"Collect interval: {interval}s")
+    print(f"Price interval: {PRICE_INTERVAL}s")
     print(f"Fetch timeout: {FETCH_TIMEOUT}s")
     print(f"Price source: Binance REST API")
+    print(f"Event loop: {'uvloop' if uvloop else 'asyncio'}")
     print(f"BTC: {len(BTC_MARKETS)} markets")
     print(f"ETH: {len(ETH_MARKETS)} markets")
     print("=" * 60)
 
-    health_thread = threading.Thread(target=run_health_server, args=(port,), daemon=True)
-    health_thread.start()
+    # Pass uvloop as the loop factory rather than installing a global policy
+    loop_factory = uvloop.new_event_loop if uvloop else None
 
     try:
-        asyncio.run(run_collector(interval))
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(run_collector(interval, port))
     except KeyboardInterrupt:
         print("\nShutting down...")
 
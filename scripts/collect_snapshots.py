@@ -10,6 +10,7 @@ Examples:
     python scripts/collect_snapshots.py
     python scripts/collect_snapshots.py --interval 10
     python scripts/collect_snapshots.py --db /path/to/data.db
+    python scripts/collect_snapshots.py --quiet
 """
 
 import argparse
@@ -19,6 +20,9 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
+
+import aiohttp
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -27,20 +31,29 @@ from poly.market_snapshot import fetch_current_snapshot, MarketSnapshot
 from poly.storage.db_writer import get_db_writer
 from poly.api.binance import get_btc_price
 
-# Global flag for graceful shutdown
-running = True
+# Connection pool settings for the long-lived collector session
+CONNECTOR_LIMIT = 10
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
 
 
-def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully."""
-    global running
-    print("\n\nShutting down...")
-    running = False
+def _fmt_side(name: str, levels: list) -> str:
+    """Format the last three levels of one orderbook side."""
+    if not levels:
+        return f"  {name} (0): []"
+    levels_str = " ".join(f"{l.price_f:.2f}:{l.size_f:.0f}" for l in levels[-3:])
+    return f"  {name} ({len(levels)}): [...{levels_str}]"
 
 
-def print_snapshot(snapshot: MarketSnapshot, btc_price: float, query_time: float) -> None:
+def print_snapshot(
+    snapshot: MarketSnapshot,
+    btc_price: float,
+    query_time: float,
+    now: Optional[datetime] = None,
+) -> None:
     """Print snapshot in a compact format."""
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
 
     # Time remaining until resolution
     resolution_delta = (snapshot.resolution_time - now).total_seconds()
@@ -54,79 +67,73 @@ def print_snapshot(snapshot: MarketSnapshot, btc_price: float, query_time: float
     print(f"  BTC: ${btc_price:,.2f}")
 
     # Calculate real bid/ask from deepest levels (where orders actually meet)
-    real_yes_bid = snapshot.depth_yes_bids[-1].price if snapshot.depth_yes_bids else None
-    real_yes_ask = snapshot.depth_yes_asks[-1].price if snapshot.depth_yes_asks else None
+    real_yes_bid = snapshot.yes_bids[-1].price_f if snapshot.yes_bids else None
+    real_yes_ask = snapshot.yes_asks[-1].price_f if snapshot.yes_asks else None
     if real_yes_bid and real_yes_ask:
-        real_mid = (float(real_yes_bid) + float(real_yes_ask)) / 2
-        real_spread = float(real_yes_ask) - float(real_yes_bid)
-        print(f"  Market: {float(real_yes_bid):.2f} / {float(real_yes_ask):.2f} (mid={real_mid*100:.1f}%, spread={real_spread:.2f})")
+        real_mid = (real_yes_bid + real_yes_ask) / 2
+        real_spread = real_yes_ask - real_yes_bid
+        print(f"  Market: {real_yes_bid:.2f} / {real_yes_ask:.2f} (mid={real_mid*100:.1f}%, spread={real_spread:.2f})")
     else:
         print(f"  Market: N/A")
 
     # Print orderbook depth (top 3 levels each side, with total count)
-    yes_bids_count = len(snapshot.depth_yes_bids)
-    yes_asks_count = len(snapshot.depth_yes_asks)
-    no_bids_count = len(snapshot.depth_no_bids)
-    no_asks_count = len(snapshot.depth_no_asks)
-
-    if snapshot.depth_yes_bids:
-        yes_bids_str = " ".join([f"{float(l.price):.2f}:{float(l.size):.0f}" for l in snapshot.depth_yes_bids[-3:]])
-        print(f"  YES Bids ({yes_bids_count}): [...{yes_bids_str}]")
-    else:
-        print(f"  YES Bids (0): []")
-    if snapshot.depth_yes_asks:
-        yes_asks_str = " ".join([f"{float(l.price):.2f}:{float(l.size):.0f}" for l in snapshot.depth_yes_asks[-3:]])
-        print(f"  YES Asks ({yes_asks_count}): [...{yes_asks_str}]")
-    else:
-        print(f"  YES Asks (0): []")
-    if snapshot.depth_no_bids:
-        no_bids_str = " ".join([f"{float(l.price):.2f}:{float(l.size):.0f}" for l in snapshot.depth_no_bids[-3:]])
-        print(f"  NO Bids  ({no_bids_count}): [...{no_bids_str}]")
-    else:
-        print(f"  NO Bids  (0): []")
-    if snapshot.depth_no_asks:
-        no_asks_str = " ".join([f"{float(l.price):.2f}:{float(l.size):.0f}" for l in snapshot.depth_no_asks[-3:]])
-        print(f"  NO Asks  ({no_asks_count}): [...{no_asks_str}]")
-    else:
-        print(f"  NO Asks  (0): []")
+    print(_fmt_side("YES Bids", snapshot.yes_bids))
+    print(_fmt_side("YES Asks", snapshot.yes_asks))
+    print(_fmt_side("NO Bids ", snapshot.no_bids))
+    print(_fmt_side("NO Asks ", snapshot.no_asks))
 
     print(f"  Resolution in: {time_left} | Query: {query_time*1000:.0f}ms")
     print("-" * 70)
 
 
-async def fetch_and_store(writer) -> tuple[bool, float]:
+async def fetch_and_store(
+    session: aiohttp.ClientSession,
+    writer,
+    quiet: bool = False,
+) -> tuple[bool, float]:
     """Fetch snapshot and store to database.
 
+    Args:
+        session: Shared aiohttp session for Polymarket and Binance requests.
+        writer: Database writer.
+        quiet: Skip printing the snapshot (errors are still printed).
+
     Returns:
         Tuple of (success, query_time_seconds)
     """
-    start_time = time.time()
+    start_time = time.monotonic()
+    now = datetime.now(timezone.utc)
 
     try:
-        # Fetch snapshot and BTC price concurrently
-        snapshot, btc_price = await asyncio.gather(
-            fetch_current_snapshot(),
-            get_btc_price(),
-        )
-        query_time = time.time() - start_time
+        # Sequential on purpose: the snapshot is built around the spot price,
+        # so it cannot be fetched until the BTC price is known
+        btc_price = await get_btc_price(session)
+        if btc_price is None:
+            query_time = time.monotonic() - start_time
+            print(f"[{now.strftime('%H:%M:%S')}] Failed to fetch BTC price, skipping snapshot")
+            return False, query_time
+
+        snapshot = await fetch_current_snapshot(btc_price, session=session)
+        query_time = time.monotonic() - start_time
 
         if snapshot is None:
-            print(f"[{datetime.now(timezone.utc).strftime('%H:%M:%S')}] Failed to fetch snapshot")
+            print(f"[{now.strftime('%H:%M:%S')}] Failed to fetch snapshot")
             return False, query_time
 
-        btc_price_float = float(btc_price) if btc_price else 0.0
+        btc_price_float = float(btc_price)
 
         # Store to database (with BTC price in depth_json)
         writer.write_snapshot_from_obj(snapshot, horizon="15m", btc_price=btc_price_float)
 
         # Print snapshot
-        print_snapshot(snapshot, btc_price_float, query_time)
+        if not quiet:
+            print_snapshot(snapshot, btc_price_float, query_time, now=now)
 
         return True, query_time
 
     except Exception as e:
-        query_time = time.time() - start_time
-        print(f"[{datetime.now(timezone.utc).strftime('%H:%M:%S')}] Error: {e}")
+        query_time = time.monotonic() - start_time
+        print(f"[{now.strftime('%H:%M:%S')}] Error: {e}")
         return False, query_time
 
 
@@ -136,13 +143,19 @@ async def main(
     db_path: str,
     project_id: str,
     instance_id: str,
+    quiet: bool = False,
 ):
     """Main collection loop."""
-    global running
+    # Setup signal handlers: wake the loop immediately on Ctrl+C / SIGTERM
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
 
-    # Setup signal handler
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    def request_stop() -> None:
+        print("\n\nShutting down...")
+        stop.set()
+
+    loop.add_signal_handler(signal.SIGINT, request_stop)
+    loop.add_signal_handler(signal.SIGTERM, request_stop)
 
     print("=" * 60)
     print("POLYMARKET SNAPSHOT COLLECTOR")
@@ -168,9 +181,16 @@ async def main(
     success_count = 0
     error_count = 0
 
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTOR_LIMIT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    session = aiohttp.ClientSession(connector=connector)
+
     try:
-        while running:
-            success, query_time = await fetch_and_store(writer)
+        while not stop.is_set():
+            success, query_time = await fetch_and_store(session, writer, quiet=quiet)
 
             if success:
                 success_count += 1
@@ -180,12 +200,14 @@ async def main(
             # Calculate sleep time (interval minus query time)
             sleep_time = max(0.1, interval - query_time)
 
-            # Sleep in small increments to check running flag
-            sleep_end = time.time() + sleep_time
-            while running and time.time() < sleep_end:
-                await asyncio.sleep(0.1)
+            # Sleep until the next tick or until a stop signal arrives
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=sleep_time)
+            except asyncio.TimeoutError:
+                pass
 
     finally:
+        await session.close()
         writer.close()
 
         print()
@@ -239,6 +261,11 @@ if __name__ == "__main__":
         default="",
         help="Bigtable instance ID (for bigtable backend)"
     )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Don't print each snapshot (useful under nohup)"
+    )
 
     args = parser.parse_args()
 
@@ -248,4 +275,5 @@ if __name__ == "__main__":
         db_path=args.db,
         project_id=args.project,
         instance_id=args.instance,
+        quiet=args.quiet,
     ))
@@ -11,22 +11,57 @@ Usage:
     python scripts/download_binance_klines.py -d 100       # Ensure 100 days of history
     python scripts/download_binance_klines.py -c           # Check for gaps only
     python scripts/download_binance_klines.py -d 10 -f     # Force re-download
+    python scripts/download_binance_klines.py -d 365 --fast  # Backfill without fsync
+    python scripts/download_binance_klines.py --parquet klines.parquet  # Update + export
 """
 
 import argparse
 import asyncio
+import csv
 import io
 import sqlite3
+import tempfile
 import zipfile
 from datetime import datetime, timedelta, timezone
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import aiohttp
 
+# numpy is optional; without it CSVs are parsed with csv.reader
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Data URL format
 BASE_URL = "https://data.binance.vision/data/spot/daily/klines"
 
+# Downloaded zips are spooled in memory up to this size, then to disk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Chunk size for streaming zip downloads
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Default maximum number of daily zip files downloaded concurrently
+DOWNLOAD_CONCURRENCY = 8
+
+# HTTP connection pool: keep sockets to data.binance.vision alive across days
+CONNECTOR_LIMIT = 32
+CONNECTOR_LIMIT_PER_HOST = 16
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+
+# Per-request timeout for a single daily zip download (seconds)
+DOWNLOAD_TIMEOUT = 60
+
+# Parsed days buffered between the downloaders and the SQLite writer
+WRITE_QUEUE_SIZE = 4
+
+# Rows stored per transaction during multi-day downloads
+COMMIT_EVERY_ROWS = 10_000
+
 # Default database path
 DEFAULT_DB_PATH = Path(__file__).parent.parent / "binance_klines.db"
 
@@ -46,6 +81,22 @@ KLINE_COLUMNS = [
     "ignore",          # Ignore
 ]
 
+# Timestamps above this are microseconds (16 digits) rather than
+# milliseconds (13 digits); newer Binance files use microseconds
+MICROSECOND_THRESHOLD = 10_000_000_000_000
+
+# Columns stored in SQLite (all but "ignore"), and which of them are integers
+STORED_COLUMNS = KLINE_COLUMNS[:11]
+INT_COLUMNS = ("open_time", "close_time", "trades")
+
+# Typed record layout for parsing the stored CSV columns with numpy
+KLINE_DTYPE = np.dtype([
+    (name, "i8" if name in INT_COLUMNS else "f8") for name in STORED_COLUMNS
+]) if np is not None else None
+
+# Rows fetched per batch when exporting klines to Parquet
+EXPORT_BATCH_ROWS = 100_000
+
 # SQLite schema
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS klines (
@@ -65,9 +116,88 @@ CREATE TABLE IF NOT EXISTS klines (
     PRIMARY KEY (symbol, interval, open_time)
 );
 
-CREATE INDEX IF NOT EXISTS idx_klines_symbol_time ON klines(symbol, interval, open_time);
+-- The primary key already indexes (symbol, interval, open_time); this
+-- duplicate index only doubled B-tree maintenance on every insert
+DROP INDEX IF EXISTS idx_klines_symbol_time;
 """
 
+# Kline insert statement. Only primary-key duplicates are skipped; unlike
+# INSERT OR IGNORE, other constraint violations still raise
+INSERT_SQL = """
+INSERT INTO klines (
+    symbol, interval, open_time, open, high, low, close,
+    volume, close_time, quote_volume, trades,
+    taker_buy_base, taker_buy_quote
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (symbol, interval, open_time) DO NOTHING
+"""
+
+# Size of the per-connection prepared statement cache
+CACHED_STATEMENTS = 256
+
+# Connection tuning: WAL lets readers run alongside the writer, and
+# synchronous=NORMAL only syncs at WAL checkpoints instead of every commit
+CONNECTION_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",      # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",    # 256 MiB memory-mapped I/O
+]
+
+
+def _parse_rows_numpy(text: io.TextIOBase, symbol: str, interval: str) -> list[tuple]:
+    """Parse a kline CSV into storage-ready tuples with one vectorized pass.
+
+    Columns are parsed straight into KLINE_DTYPE, so integer columns never
+    round-trip through float; tolist() yields native ints/floats for SQLite.
+    """
+    arr = np.loadtxt(
+        text,
+        delimiter=",",
+        usecols=range(len(KLINE_DTYPE)),
+        dtype=KLINE_DTYPE,
+        ndmin=1,
+    )
+    return list(zip(
+        repeat(symbol),
+        repeat(interval),
+        *(arr[name].tolist() for name in KLINE_DTYPE.names),
+    ))
+
+
+def _parse_rows_csv(text: io.TextIOBase, symbol: str, interval: str) -> list[tuple]:
+    """Parse a kline CSV into storage-ready tuples with csv.reader."""
+    records = []
+    for v in csv.reader(text):
+        if len(v) < 12:
+            continue
+        open_, high, low, close, volume = map(float, v[1:6])
+        records.append((
+            symbol,
+            interval,
+            int(v[0]),
+            open_,
+            high,
+            low,
+            close,
+            volume,
+            int(v[6]),
+            float(v[7]),
+            int(v[8]),
+            float(v[9]),
+            float(v[10]),
+        ))
+    return records
+
+
+_parse_rows = _parse_rows_numpy if np is not None else _parse_rows_csv
+
+
+def _day_from_ordinal(ordinal: int) -> datetime:
+    """Convert a date ordinal to a UTC-midnight datetime."""
+    return datetime.fromordinal(ordinal).replace(tzinfo=timezone.utc)
+
 
 class KlineDownloader:
     """Downloads and stores Binance kline data."""
@@ -77,10 +207,28 @@ class KlineDownloader:
         db_path: Optional[Path] = None,
         symbol: str = "BTCUSDT",
         interval: str = "1m",
+        fast: bool = False,
+        concurrency: int = DOWNLOAD_CONCURRENCY,
     ):
+        """Initialize the downloader.
+
+        Args:
+            db_path: SQLite database path (default: binance_klines.db).
+            symbol: Trading pair symbol.
+            interval: Kline interval.
+            fast: Disable fsync entirely (synchronous=OFF). Only for one-shot
+                backfills where the database can be re-downloaded if corrupted.
+            concurrency: Maximum number of days downloaded at once.
+        """
         self.db_path = db_path or DEFAULT_DB_PATH
         self.symbol = symbol.upper()
         self.interval = interval
+        self.fast = fast
+        self.concurrency = max(1, concurrency)
+        # Everything in the download URL except the date, built once
+        self._url_prefix = (
+            f"{BASE_URL}/{self.symbol}/{self.interval}/{self.symbol}-{self.interval}"
+        )
         self._conn: Optional[sqlite3.Connection] = None
         self._ensure_schema()
 
@@ -93,13 +241,23 @@ class KlineDownloader:
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
-            self._conn.row_factory = sqlite3.Row
+            # The writer runs in a worker thread; access is still serialized
+            self._conn = sqlite3.connect(
+                str(self.db_path),
+                cached_statements=CACHED_STATEMENTS,
+                check_same_thread=False,
+            )
+            for pragma in CONNECTION_PRAGMAS:
+                self._conn.execute(pragma)
+            if self.fast:
+                self._conn.execute("PRAGMA synchronous=OFF")
         return self._conn
 
     def close(self) -> None:
         """Close database connection."""
         if self._conn:
+            # Let SQLite refresh planner statistics for tables that need it
+            self._conn.execute("PRAGMA optimize")
             self._conn.close()
             self._conn = None
 
@@ -112,15 +270,17 @@ class KlineDownloader:
         Returns:
             Full URL to the zip file.
         """
-        date_str = date.strftime("%Y-%m-%d")
-        filename = f"{self.symbol}-{self.interval}-{date_str}.zip"
-        return f"{BASE_URL}/{self.symbol}/{self.interval}/{filename}"
+        return self._url_for(date.strftime("%Y-%m-%d"))
+
+    def _url_for(self, date_str: str) -> str:
+        """Build the download URL from an already formatted YYYY-MM-DD date."""
+        return f"{self._url_prefix}-{date_str}.zip"
 
     async def download_day(
         self,
         session: aiohttp.ClientSession,
         date: datetime,
-    ) -> list[dict]:
+    ) -> list[tuple]:
         """Download kline data for a single day.
 
         Args:
@@ -128,115 +288,78 @@ class KlineDownloader:
             date: Date to download.
 
         Returns:
-            List of kline records as dictionaries.
+            List of kline rows as tuples in klines column order.
         """
-        url = self.get_download_url(date)
         date_str = date.strftime("%Y-%m-%d")
+        url = self._url_for(date_str)
 
-        try:
-            async with session.get(url) as resp:
-                if resp.status == 404:
-                    print(f"  [{date_str}] Not available (404)")
-                    return []
-                elif resp.status != 200:
-                    print(f"  [{date_str}] HTTP {resp.status}")
-                    return []
+        # Stream the zip into a spooled buffer instead of one big bytes object
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buf:
+            try:
+                async with session.get(url) as resp:
+                    if resp.status == 404:
+                        print(f"  [{date_str}] Not available (404)")
+                        return []
+                    elif resp.status != 200:
+                        print(f"  [{date_str}] HTTP {resp.status}")
+                        return []
 
-                data = await resp.read()
+                    async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        buf.write(chunk)
 
-        except aiohttp.ClientError as e:
-            print(f"  [{date_str}] Download error: {e}")
-            return []
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"  [{date_str}] Download error: {e!r}")
+                return []
 
-        # Extract and parse CSV from zip
-        try:
-            with zipfile.ZipFile(io.BytesIO(data)) as zf:
-                # Get the first (and only) file in the zip
-                csv_name = zf.namelist()[0]
-                csv_data = zf.read(csv_name).decode("utf-8")
-
-        except zipfile.BadZipFile:
-            print(f"  [{date_str}] Invalid zip file")
-            return []
-
-        # Parse CSV lines
-        records = []
-        for line in csv_data.strip().split("\n"):
-            if not line:
-                continue
-            values = line.split(",")
-            if len(values) < 12:
-                continue
-
-            record = {
-                "symbol": self.symbol,
-                "interval": self.interval,
-                "open_time": int(values[0]),
-                "open": float(values[1]),
-                "high": float(values[2]),
-                "low": float(values[3]),
-                "close": float(values[4]),
-                "volume": float(values[5]),
-                "close_time": int(values[6]),
-                "quote_volume": float(values[7]),
-                "trades": int(values[8]),
-                "taker_buy_base": float(values[9]),
-                "taker_buy_quote": float(values[10]),
-            }
-            records.append(record)
+            buf.seek(0)
+
+            try:
+                with zipfile.ZipFile(buf) as zf:
+                    # Get the first (and only) file in the zip
+                    csv_name = zf.namelist()[0]
+                    with zf.open(csv_name) as raw:
+                        text = io.TextIOWrapper(raw, encoding="ascii", newline="")
+                        records = _parse_rows(text, self.symbol, self.interval)
+
+            except zipfile.BadZipFile:
+                print(f"  [{date_str}] Invalid zip file")
+                return []
 
         print(f"  [{date_str}] Downloaded {len(records):,} klines")
         return records
 
-    def store_records(self, records: list[dict]) -> int:
+    def store_records(self, records: Iterable[tuple], in_transaction: bool = False) -> int:
         """Store kline records in SQLite.
 
         Args:
-            records: List of kline dictionaries.
+            records: Kline tuples as returned by download_day().
+            in_transaction: The caller already opened a transaction and will
+                commit it; don't begin or commit one here.
 
         Returns:
-            Number of records inserted.
+            Number of records inserted (existing rows are not counted).
         """
         if not records:
             return 0
 
         conn = self._get_connection()
-        cursor = conn.cursor()
-
-        inserted = 0
-        for record in records:
-            try:
-                cursor.execute(
-                    """
-                    INSERT OR IGNORE INTO klines (
-                        symbol, interval, open_time, open, high, low, close,
-                        volume, close_time, quote_volume, trades,
-                        taker_buy_base, taker_buy_quote
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record["symbol"],
-                        record["interval"],
-                        record["open_time"],
-                        record["open"],
-                        record["high"],
-                        record["low"],
-                        record["close"],
-                        record["volume"],
-                        record["close_time"],
-                        record["quote_volume"],
-                        record["trades"],
-                        record["taker_buy_base"],
-                        record["taker_buy_quote"],
-                    ),
-                )
-                if cursor.rowcount > 0:
-                    inserted += 1
-            except sqlite3.IntegrityError:
-                pass  # Duplicate, skip
-
+        # Skipped duplicates don't count as changes, so the total_changes
+        # delta is the number of rows actually inserted.
+        before = conn.total_changes
+        if in_transaction:
+            conn.executemany(INSERT_SQL, records)
+            return conn.total_changes - before
+
+        # One explicit transaction for the whole batch so SQLite journals
+        # and syncs once per call instead of once per row.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(INSERT_SQL, records)
+        except BaseException:
+            conn.rollback()
+            raise
         conn.commit()
-        return inserted
+        return conn.total_changes - before
 
     async def download_dates(
         self,
@@ -255,19 +378,101 @@ class KlineDownloader:
         if not dates:
             return 0, 0
 
+        sem = asyncio.Semaphore(self.concurrency)
+        queue: asyncio.Queue[Optional[list[tuple]]] = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+
+        # Downloaders push parsed days onto the queue while a single writer
+        # drains it, so SQLite inserts overlap with the next HTTP fetches
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTOR_LIMIT,
+            limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        timeout = aiohttp.ClientTimeout(total=DOWNLOAD_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            async with asyncio.TaskGroup() as tg:
+                writer = tg.create_task(self._store_from_queue(queue))
+                async with asyncio.TaskGroup() as downloads:
+                    for date in sorted(dates):
+                        downloads.create_task(self._download_to_queue(sem, session, date, queue))
+                await queue.put(None)
+
+        return writer.result()
+
+    async def _download_to_queue(
+        self,
+        sem: asyncio.Semaphore,
+        session: aiohttp.ClientSession,
+        date: datetime,
+        queue: asyncio.Queue,
+    ) -> None:
+        """Download a single day while holding a concurrency slot and queue its rows."""
+        async with sem:
+            records = await self.download_day(session, date)
+        if records:
+            await queue.put(records)
+
+    async def _store_from_queue(self, queue: asyncio.Queue) -> tuple[int, int]:
+        """Store queued days until a None sentinel arrives.
+
+        Days already waiting in the queue are coalesced into a single
+        executemany. All days share one transaction, checkpointed every
+        COMMIT_EVERY_ROWS rows so a failure mid-run keeps the rows committed
+        before it. Inserts and commits run in a worker thread to keep the
+        event loop responsive.
+
+        Returns:
+            Tuple of (total_records, inserted_records).
+        """
+        conn = self._get_connection()
         total_records = 0
         total_inserted = 0
+        uncommitted = 0
+        done = False
+        # In-flight worker-thread call; cancelling our await does not stop it
+        pending: Optional[asyncio.Future] = None
 
-        async with aiohttp.ClientSession() as session:
-            for date in sorted(dates):
-                records = await self.download_day(session, date)
-                if records:
-                    inserted = self.store_records(records)
-                    total_records += len(records)
-                    total_inserted += inserted
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            while not done and (records := await queue.get()) is not None:
+                days = [records]
+                while not queue.empty():
+                    records = queue.get_nowait()
+                    if records is None:
+                        done = True
+                        break
+                    days.append(records)
+
+                rows = chain.from_iterable(days)
+                pending = asyncio.ensure_future(
+                    asyncio.to_thread(self.store_records, rows, True)
+                )
+                inserted = await asyncio.shield(pending)
+                batch_size = sum(map(len, days))
+                total_records += batch_size
+                total_inserted += inserted
+                uncommitted += batch_size
+                if uncommitted >= COMMIT_EVERY_ROWS:
+                    pending = asyncio.ensure_future(asyncio.to_thread(self._checkpoint))
+                    await asyncio.shield(pending)
+                    uncommitted = 0
+        except BaseException:
+            # Let the worker thread finish with the connection before rolling back
+            if pending is not None:
+                await asyncio.wait({pending})
+            await asyncio.to_thread(conn.rollback)
+            raise
+        await asyncio.to_thread(conn.commit)
 
         return total_records, total_inserted
 
+    def _checkpoint(self) -> None:
+        """Commit the open transaction and immediately start a new one."""
+        conn = self._get_connection()
+        conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+
     async def update(self, target_days: int = 10) -> dict:
         """Incrementally update database with missing data.
 
@@ -296,8 +501,8 @@ class KlineDownloader:
         else:
             print("No existing data found")
 
-        # Find missing dates
-        missing_dates = self.get_missing_dates(target_days)
+        # Find missing dates (reusing the range queried above)
+        missing_dates = self.get_missing_dates(target_days, (oldest, newest))
 
         # Find dates with gaps (need re-download)
         print("Checking for gaps...")
@@ -344,29 +549,68 @@ class KlineDownloader:
             "gaps_after": len(remaining_gaps),
         }
 
-    async def download_range(self, days: int = 10) -> tuple[int, int]:
+    async def download_range(
+        self,
+        days: int = 10,
+        skip_complete: bool = True,
+    ) -> tuple[int, int]:
         """Download kline data for the past N days (legacy method).
 
         Prefer using update() for incremental downloads.
 
         Args:
             days: Number of days to download (default: 10).
+            skip_complete: Skip days that already have every kline stored.
+                Pass False to re-download the whole range (--force).
 
         Returns:
             Tuple of (total_records, inserted_records).
         """
         today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
         dates = [today - timedelta(days=d) for d in range(1, days + 1)]
-        return await self.download_dates(dates)
 
-    def _normalize_timestamp(self, ts: int) -> int:
-        """Normalize timestamp to milliseconds.
+        if not skip_complete:
+            return await self.download_dates(dates)
+
+        # Days already fully stored would insert nothing; skip the HTTP fetch
+        to_download = [d for d in dates if not self.is_day_complete(d)]
+        skipped = len(dates) - len(to_download)
+        if skipped:
+            print(f"  Skipping {skipped} day(s) already complete in database")
 
-        Handles both millisecond (13 digits) and microsecond (16 digits) formats.
+        return await self.download_dates(to_download)
+
+    def is_day_complete(self, date: datetime) -> bool:
+        """Check whether every kline for a day is already stored.
+
+        Args:
+            date: Day to check (midnight UTC).
+
+        Returns:
+            True if the day has the full expected number of klines.
         """
-        if ts > 10_000_000_000_000:  # More than 13 digits = microseconds
-            return ts // 1000
-        return ts
+        interval_ms = self._get_interval_ms()
+        day_start_ms = int(date.timestamp() * 1000)
+        day_end_ms = day_start_ms + 86_400_000 - interval_ms
+
+        # Newer Binance files use microsecond timestamps, so match both units
+        conn = self._get_connection()
+        (count,) = conn.execute(
+            """
+            SELECT COUNT(*) FROM klines
+            WHERE symbol = ? AND interval = ?
+              AND (open_time BETWEEN ? AND ? OR open_time BETWEEN ? AND ?)
+            """,
+            (
+                self.symbol,
+                self.interval,
+                day_start_ms,
+                day_end_ms,
+                day_start_ms * 1000,
+                day_end_ms * 1000,
+            ),
+        ).fetchone()
+        return count >= 86_400_000 // interval_ms
 
     def get_time_range(self) -> tuple[Optional[datetime], Optional[datetime]]:
         """Get the time range of existing data in the database.
@@ -382,59 +626,51 @@ class KlineDownloader:
             """,
             (self.symbol, self.interval),
         )
-        row = cursor.fetchone()
-
-        min_time = row["min_time"]
-        max_time = row["max_time"]
+        min_time, max_time = cursor.fetchone()
 
         if min_time and max_time:
             # Normalize to milliseconds and convert to datetime
-            min_ms = self._normalize_timestamp(min_time)
-            max_ms = self._normalize_timestamp(max_time)
+            min_ms = min_time // 1000 if min_time > MICROSECOND_THRESHOLD else min_time
+            max_ms = max_time // 1000 if max_time > MICROSECOND_THRESHOLD else max_time
             min_dt = datetime.fromtimestamp(min_ms / 1000, tz=timezone.utc)
             max_dt = datetime.fromtimestamp(max_ms / 1000, tz=timezone.utc)
             return min_dt, max_dt
 
         return None, None
 
-    def get_missing_dates(self, target_days: int) -> list[datetime]:
+    def get_missing_dates(
+        self,
+        target_days: int,
+        time_range: Optional[tuple[Optional[datetime], Optional[datetime]]] = None,
+    ) -> list[datetime]:
         """Find dates that need to be downloaded.
 
         Args:
             target_days: Desired number of days of history.
+            time_range: (oldest, newest) from get_time_range(), if the caller
+                already has it. Queried from the database when omitted.
 
         Returns:
             List of dates (as datetime) that need downloading.
         """
-        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        yesterday = today - timedelta(days=1)
+        # Work in integer day ordinals and only build datetimes for the result
+        today_ord = datetime.now(timezone.utc).date().toordinal()
+        target_start_ord = today_ord - target_days
 
-        # Target date range
-        target_start = today - timedelta(days=target_days)
-
-        oldest, newest = self.get_time_range()
+        oldest, newest = time_range if time_range is not None else self.get_time_range()
 
         if oldest is None or newest is None:
-            # No data at all - download everything
-            return [today - timedelta(days=d) for d in range(1, target_days + 1)]
-
-        missing_dates = []
-
-        # Check for dates older than what we have
-        current = target_start
-        while current < oldest.replace(hour=0, minute=0, second=0, microsecond=0):
-            if current < today:  # Don't try to download today
-                missing_dates.append(current)
-            current += timedelta(days=1)
-
-        # Check for dates newer than what we have (up to yesterday)
-        newest_date = newest.replace(hour=0, minute=0, second=0, microsecond=0)
-        current = newest_date + timedelta(days=1)
-        while current <= yesterday:
-            missing_dates.append(current)
-            current += timedelta(days=1)
+            # No data at all - download everything (today isn't available yet)
+            missing = range(target_start_ord, today_ord)
+        else:
+            # Dates older than what we have, plus dates newer than what we
+            # have up to yesterday
+            missing = chain(
+                range(target_start_ord, min(oldest.date().toordinal(), today_ord)),
+                range(newest.date().toordinal() + 1, today_ord),
+            )
 
-        return sorted(missing_dates)
+        return [_day_from_ordinal(o) for o in sorted(set(missing))]
 
     def find_gaps(self) -> list[tuple[datetime, datetime]]:
         """Find gaps in the kline data.
@@ -447,31 +683,39 @@ class KlineDownloader:
         # Get interval in milliseconds
         interval_ms = self._get_interval_ms()
 
-        # Query all timestamps ordered
+        # Let SQLite compare each kline with its predecessor so only the gaps
+        # cross into Python. Timestamps are normalized to milliseconds first
+        # (newer files use microseconds); raw open_time order is already
+        # chronological because every microsecond value sorts after every
+        # millisecond one.
         cursor = conn.execute(
             """
-            SELECT open_time FROM klines
-            WHERE symbol = ? AND interval = ?
-            ORDER BY open_time ASC
+            SELECT prev_time, ts FROM (
+                SELECT ts, LAG(ts) OVER (ORDER BY open_time) AS prev_time
+                FROM (
+                    SELECT open_time,
+                           CASE WHEN open_time > :us_threshold
+                                THEN open_time / 1000 ELSE open_time END AS ts
+                    FROM klines
+                    WHERE symbol = :symbol AND interval = :interval
+                )
+            )
+            WHERE ts - prev_time > :interval_ms
             """,
-            (self.symbol, self.interval),
+            {
+                "symbol": self.symbol,
+                "interval": self.interval,
+                "interval_ms": interval_ms,
+                "us_threshold": MICROSECOND_THRESHOLD,
+            },
         )
 
         gaps = []
-        prev_time = None
-
-        for row in cursor:
-            ts = self._normalize_timestamp(row["open_time"])
-
-            if prev_time is not None:
-                expected_next = prev_time + interval_ms
-                if ts > expected_next:
-                    # Gap detected
-                    gap_start = datetime.fromtimestamp(expected_next / 1000, tz=timezone.utc)
-                    gap_end = datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
-                    gaps.append((gap_start, gap_end))
-
-            prev_time = ts
+        for prev_time, ts in cursor:
+            expected_next = prev_time + interval_ms
+            gap_start = datetime.fromtimestamp(expected_next / 1000, tz=timezone.utc)
+            gap_end = datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
+            gaps.append((gap_start, gap_end))
 
         return gaps
 
@@ -496,17 +740,63 @@ class KlineDownloader:
             Set of dates (as midnight datetime) that have gaps.
         """
         gaps = self.find_gaps()
-        dates_with_gaps = set()
+        day_ordinals: set[int] = set()
 
         for gap_start, gap_end in gaps:
-            # Add all dates covered by this gap
-            current = gap_start.replace(hour=0, minute=0, second=0, microsecond=0)
-            gap_end_date = gap_end.replace(hour=0, minute=0, second=0, microsecond=0)
-            while current <= gap_end_date:
-                dates_with_gaps.add(current)
-                current += timedelta(days=1)
+            # Add all dates covered by this gap, as integer day ordinals
+            day_ordinals.update(
+                range(gap_start.date().toordinal(), gap_end.date().toordinal() + 1)
+            )
 
-        return dates_with_gaps
+        return {_day_from_ordinal(o) for o in day_ordinals}
+
+    def export_parquet(self, path: Path) -> int:
+        """Export this symbol/interval's klines to a ZSTD-compressed Parquet file.
+
+        SQLite stays the system of record for incremental upserts; the Parquet
+        copy is for fast columnar scans. Timestamps are normalized to
+        milliseconds. Requires pyarrow.
+
+        Args:
+            path: Output Parquet file path (overwritten).
+
+        Returns:
+            Number of klines exported.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([
+            (name, pa.int64() if name in INT_COLUMNS else pa.float64())
+            for name in STORED_COLUMNS
+        ])
+        select_cols = ", ".join(
+            f"CASE WHEN {name} > {MICROSECOND_THRESHOLD} THEN {name} / 1000 ELSE {name} END"
+            if name in ("open_time", "close_time") else name
+            for name in STORED_COLUMNS
+        )
+
+        conn = self._get_connection()
+        cursor = conn.execute(
+            f"""
+            SELECT {select_cols} FROM klines
+            WHERE symbol = ? AND interval = ?
+            ORDER BY open_time ASC
+            """,
+            (self.symbol, self.interval),
+        )
+
+        exported = 0
+        with pq.ParquetWriter(str(path), schema, compression="zstd") as writer:
+            while rows := cursor.fetchmany(EXPORT_BATCH_ROWS):
+                columns = [
+                    pa.array(values, type=field.type)
+                    for values, field in zip(zip(*rows), schema)
+                ]
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+                exported += len(rows)
+
+        return exported
 
     def get_stats(self) -> dict:
         """Get database statistics."""
@@ -516,7 +806,7 @@ class KlineDownloader:
             "SELECT COUNT(*) as count FROM klines WHERE symbol = ? AND interval = ?",
             (self.symbol, self.interval),
         )
-        count = cursor.fetchone()["count"]
+        (count,) = cursor.fetchone()
 
         oldest, newest = self.get_time_range()
 
@@ -583,6 +873,24 @@ async def main():
         action="store_true",
         help="Force re-download of all dates in range (not incremental)",
     )
+    parser.add_argument(
+        "-j", "--concurrency",
+        type=int,
+        default=DOWNLOAD_CONCURRENCY,
+        help=f"Maximum concurrent day downloads (default: {DOWNLOAD_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--parquet",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="After downloading, export klines to a ZSTD Parquet file (requires pyarrow)",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip fsync (synchronous=OFF) for one-shot backfills; DB may corrupt on crash",
+    )
     args = parser.parse_args()
 
     db_path = Path(args.db) if args.db else None
@@ -590,6 +898,8 @@ async def main():
         db_path=db_path,
         symbol=args.symbol,
         interval=args.interval,
+        fast=args.fast,
+        concurrency=args.concurrency,
     )
 
     try:
@@ -622,7 +932,9 @@ async def main():
         elif args.force:
             # Force re-download everything
             print(f"Force downloading {args.days} days of {args.symbol} {args.interval} data...")
-            total, inserted = await downloader.download_range(days=args.days)
+            total, inserted = await downloader.download_range(
+                days=args.days, skip_complete=False
+            )
 
             print()
             print("=" * 50)
@@ -653,6 +965,10 @@ async def main():
                     remaining = downloader.find_gaps()
                     print_gaps(remaining, max_show=5)
 
+        if args.parquet:
+            exported = downloader.export_parquet(Path(args.parquet))
+            print(f"\nExported {exported:,} klines to {args.parquet}")
+
         # Always show final stats
         stats = downloader.get_stats()
         print()
@@ -36,20 +36,90 @@ USAGE:
     python scripts/generate_rolling_klines.py --window 5         # 5-minute
     python scripts/generate_rolling_klines.py --window 15        # 15-minute
     python scripts/generate_rolling_klines.py --symbol ETHUSDT --window 5
+    python scripts/generate_rolling_klines.py --window 5 --sql   # aggregate in SQLite
+    python scripts/generate_rolling_klines.py --symbols BTCUSDT,ETHUSDT --window 5
+    python scripts/generate_rolling_klines.py --window 5 --parquet klines_5min.parquet
 
 ================================================================================
 """
 
+from __future__ import annotations
+
 import argparse
+import os
 import sqlite3
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
 from pathlib import Path
+from typing import Iterator, Optional
+
+# numpy is optional; without it windows are aggregated over plain lists
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:
+    np = None
+
+# numba is optional; without it highs/lows use a sliding-window view
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Default paths
 DEFAULT_INPUT_DB = Path(__file__).parent.parent / "binance_klines.db"
 
+# Output database tuning for a single bulk load
+OUTPUT_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-262144",     # 256 MiB page cache
+    "PRAGMA mmap_size=1073741824",   # 1 GiB memory-mapped I/O
+]
+
+# Column order of the N-minute klines table (after symbol)
+OUTPUT_COLUMNS = ("open_time", "open", "high", "low", "close", "volume", "close_time", "trades")
+
+# Read-only tuning for the single sequential scan of the 1-minute table.
+# (Not immutable=1: the downloader keeps the input in WAL mode, and an
+# immutable open would ignore rows not yet checkpointed into the main file.)
+INPUT_PRAGMAS = [
+    "PRAGMA cache_size=-65536",      # 64 MiB page cache
+    "PRAGMA mmap_size=4294967296",   # 4 GiB memory-mapped I/O
+]
+
+# Row layout of the 1-minute query, read straight from the cursor into NumPy
+INT_COLUMNS = ("open_time", "close_time", "trades")
+KLINE_DTYPE = np.dtype([
+    (col, np.int64 if col in INT_COLUMNS else np.float64) for col in OUTPUT_COLUMNS
+]) if np is not None else None
+
+# INSERT for the N-minute table; only the window is filled in, once per table
+INSERT_SQL = f"""
+    INSERT INTO klines_{{window}}min
+    (symbol, {", ".join(OUTPUT_COLUMNS)})
+    VALUES ({", ".join("?" * (len(OUTPUT_COLUMNS) + 1))})
+    """
+
+# Size of the per-connection prepared statement cache
+CACHED_STATEMENTS = 256
+
+# Rows converted to Python per chunk while streaming inserts
+INSERT_CHUNK_ROWS = 50_000
+
+# Rows fetched per fetchmany() call when filling the preallocated array
+FETCH_BATCH_ROWS = 65_536
+
 
 def get_schema(window: int) -> str:
-    """Get schema for N-minute klines table."""
+    """Get schema for N-minute klines table.
+
+    The table is created without a primary key or index so the bulk load only
+    appends rows; see get_post_load_sql for the index built afterwards.
+    """
     return f"""
 DROP TABLE IF EXISTS klines_{window}min;
 
@@ -62,45 +132,338 @@ CREATE TABLE klines_{window}min (
     close REAL NOT NULL,
     volume REAL NOT NULL,
     close_time INTEGER NOT NULL,
-    trades INTEGER NOT NULL,
-    PRIMARY KEY (symbol, open_time)
+    trades INTEGER NOT NULL
 );
+"""
+
+
+def get_insert_sql(window: int) -> str:
+    """Get the INSERT statement for N-minute klines, bound as (symbol, *OUTPUT_COLUMNS)."""
+    return INSERT_SQL.format(window=window)
 
-CREATE INDEX IF NOT EXISTS idx_klines_{window}min_symbol_time ON klines_{window}min(symbol, open_time);
+
+def get_window_insert_sql(window: int) -> str:
+    """Get an INSERT ... SELECT that aggregates attached ``src.klines`` in SQLite.
+
+    Each row's frame is itself plus the next window-1 rows, matching the
+    Python aggregators. Frames cut short at the end of the series are
+    dropped by requiring a full row count.
+    """
+    return f"""
+        INSERT INTO klines_{window}min
+        (symbol, {", ".join(OUTPUT_COLUMNS)})
+        SELECT symbol, {", ".join(OUTPUT_COLUMNS)}
+        FROM (
+            SELECT
+                symbol,
+                open_time,
+                open,
+                max(high) OVER w AS high,
+                min(low) OVER w AS low,
+                last_value(close) OVER w AS close,
+                sum(volume) OVER w AS volume,
+                last_value(close_time) OVER w AS close_time,
+                sum(trades) OVER w AS trades,
+                count(*) OVER w AS rows_in_window
+            FROM src.klines
+            WHERE symbol = ? AND interval = '1m'
+            WINDOW w AS (ORDER BY open_time ROWS BETWEEN CURRENT ROW AND {window - 1} FOLLOWING)
+        )
+        WHERE rows_in_window = {window}
+        ORDER BY open_time
+        """
+
+
+def get_post_load_sql(window: int) -> str:
+    """Get the index statements to run once the N-minute klines are loaded.
+
+    Rows arrive sorted by open_time, so building the unique index afterwards
+    is a sequential B-tree build instead of one index update per insert.
+    """
+    return f"""
+CREATE UNIQUE INDEX idx_klines_{window}min_symbol_time ON klines_{window}min(symbol, open_time);
+ANALYZE;
 """
 
 
-def aggregate_klines(klines: list[dict], window: int) -> dict | None:
-    """Aggregate multiple 1-min klines into a single N-min kline.
+def _rolling_extrema(
+    high: np.ndarray, low: np.ndarray, window: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling max of highs and min of lows using monotonic deques.
+
+    Each deque holds indices whose values are strictly decreasing (max) or
+    increasing (min), so every index is pushed and popped at most once and
+    the whole pass is O(N) regardless of window size. The deques are plain
+    index arrays with head/tail cursors so the loop compiles under numba.
+
+    Args:
+        high: 1-minute highs.
+        low: 1-minute lows.
+        window: Number of minutes per window.
+
+    Returns:
+        Tuple of (window_highs, window_lows), each of length N - window + 1.
+    """
+    n = len(high)
+    high_out = np.empty(n - window + 1, dtype=np.float64)
+    low_out = np.empty(n - window + 1, dtype=np.float64)
+    max_q = np.empty(n, dtype=np.int64)
+    min_q = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+
+    for i in range(n):
+        while max_tail > max_head and high[max_q[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_q[max_tail] = i
+        max_tail += 1
+
+        while min_tail > min_head and low[min_q[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_q[min_tail] = i
+        min_tail += 1
+
+        start = i - window + 1
+        if start >= 0:
+            # The window advances one row per step, so at most one index expires
+            if max_q[max_head] < start:
+                max_head += 1
+            if min_q[min_head] < start:
+                min_head += 1
+            high_out[start] = high[max_q[max_head]]
+            low_out[start] = low[min_q[min_head]]
+
+    return high_out, low_out
+
+
+if njit is not None and np is not None:
+    _rolling_extrema = njit(cache=True, boundscheck=False)(_rolling_extrema)
+
+
+def _aggregate_klines_numpy(klines: dict[str, np.ndarray], window: int) -> dict[str, np.ndarray]:
+    """Aggregate 1-min kline columns into rolling N-min kline columns.
+
+    Every output row i covers input rows i..i+window-1, so each column has
+    len - window + 1 entries. Trades come from prefix-sum differences, highs
+    and lows from the numba-compiled ``_rolling_extrema`` kernel (or a
+    sliding-window view without numba), and volume from a sliding-window sum,
+    so no per-window Python work is done. (Prefix sums are exact for integers
+    only; differencing a float cumsum loses the precision of small volumes
+    late in the series.)
+
+    Args:
+        klines: Mapping of column name to 1-D array of 1-minute values.
+        window: Number of minutes to aggregate.
+
+    Returns:
+        Mapping of column name to aggregated N-minute values
+        (empty arrays if there are fewer than ``window`` klines).
+    """
+    n = len(klines["open"])
+    if n < window:
+        return {col: klines[col][:0] for col in OUTPUT_COLUMNS}
+
+    trades_sum = np.concatenate(([0], np.cumsum(klines["trades"])))
+
+    if njit is not None:
+        high, low = _rolling_extrema(klines["high"], klines["low"], window)
+    else:
+        high = sliding_window_view(klines["high"], window).max(axis=1)
+        low = sliding_window_view(klines["low"], window).min(axis=1)
+
+    return {
+        "open_time": klines["open_time"][:n - window + 1],
+        "open": klines["open"][:n - window + 1],
+        "high": high,
+        "low": low,
+        "close": klines["close"][window - 1:],
+        "volume": sliding_window_view(klines["volume"], window).sum(axis=1),
+        "close_time": klines["close_time"][window - 1:],
+        "trades": trades_sum[window:] - trades_sum[:-window],
+    }
+
+
+def _aggregate_klines_py(klines: dict[str, list], window: int) -> dict[str, list]:
+    """Aggregate 1-min kline columns into rolling N-min columns without numpy.
+
+    Highs and lows use the same monotonic-deque scheme as ``_rolling_extrema``
+    over plain lists, and trades use integer prefix sums, so apart from the
+    C-level volume sums each step is O(1).
 
     Args:
-        klines: List of N consecutive 1-minute kline dicts.
+        klines: Mapping of column name to list of 1-minute values.
         window: Number of minutes to aggregate.
 
     Returns:
-        Aggregated N-minute kline dict, or None if invalid input.
+        Mapping of column name to lists of aggregated N-minute values.
     """
-    if len(klines) < window:
-        return None
+    n = len(klines["open"])
+    if n < window:
+        return {col: [] for col in OUTPUT_COLUMNS}
+
+    highs, lows, volumes = klines["high"], klines["low"], klines["volume"]
+    high_out, low_out = [], []
+    max_q, min_q = deque(), deque()
+
+    for i in range(n):
+        while max_q and highs[max_q[-1]] <= highs[i]:
+            max_q.pop()
+        max_q.append(i)
+
+        while min_q and lows[min_q[-1]] >= lows[i]:
+            min_q.pop()
+        min_q.append(i)
+
+        start = i - window + 1
+        if start >= 0:
+            if max_q[0] < start:
+                max_q.popleft()
+            if min_q[0] < start:
+                min_q.popleft()
+            high_out.append(highs[max_q[0]])
+            low_out.append(lows[min_q[0]])
+
+    trades_sum = [0, *accumulate(klines["trades"])]
 
     return {
-        "symbol": klines[0]["symbol"],
-        "open_time": klines[0]["open_time"],
-        "open": klines[0]["open"],
-        "high": max(k["high"] for k in klines),
-        "low": min(k["low"] for k in klines),
-        "close": klines[-1]["close"],
-        "volume": sum(k["volume"] for k in klines),
-        "close_time": klines[-1]["close_time"],
-        "trades": sum(k["trades"] for k in klines),
+        "open_time": klines["open_time"][:n - window + 1],
+        "open": klines["open"][:n - window + 1],
+        "high": high_out,
+        "low": low_out,
+        "close": klines["close"][window - 1:],
+        "volume": [sum(volumes[i:i + window]) for i in range(n - window + 1)],
+        "close_time": klines["close_time"][window - 1:],
+        "trades": [trades_sum[i + window] - trades_sum[i] for i in range(n - window + 1)],
     }
 
 
+# Aggregate with NumPy when available, otherwise over plain lists
+aggregate_klines = _aggregate_klines_numpy if np is not None else _aggregate_klines_py
+
+
+def input_uri(input_db: Path) -> str:
+    """Read-only ``file:`` URI for the 1-minute klines database."""
+    return f"{input_db.resolve().as_uri()}?mode=ro"
+
+
+def connect_input(input_db: Path) -> sqlite3.Connection:
+    """Open the 1-minute klines database read-only, tuned for one sequential scan.
+
+    Shared with kline_volatility_stats.py so both scripts read the
+    downloader's database the same way.
+    """
+    conn = sqlite3.connect(input_uri(input_db), uri=True)
+    for pragma in INPUT_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def fetch_into_array(cursor: sqlite3.Cursor, expected: int, dtype: np.dtype) -> np.ndarray:
+    """Fill a preallocated structured array from a cursor in fetchmany() chunks.
+
+    Args:
+        cursor: Executed query whose rows match ``dtype``.
+        expected: Row count from a prior COUNT(*); grows the array if exceeded.
+        dtype: Structured dtype of one row.
+
+    Returns:
+        Array trimmed to the number of rows actually fetched.
+    """
+    rows = np.empty(expected, dtype=dtype)
+    filled = 0
+    while batch := cursor.fetchmany(FETCH_BATCH_ROWS):
+        end = filled + len(batch)
+        if end > len(rows):
+            rows = np.resize(rows, end)
+        rows[filled:end] = batch
+        filled = end
+    return rows[:filled]
+
+
+def _iter_output_rows(aggregated: dict, symbol: str, window: int) -> Iterator[tuple]:
+    """Yield (symbol, *OUTPUT_COLUMNS) rows from aggregated columns.
+
+    Columns are converted to Python values one chunk at a time (``tolist()``
+    is a single C loop per column), so only one chunk of tuples exists at once.
+    """
+    generated = len(aggregated["open"])
+    for start in range(0, generated, INSERT_CHUNK_ROWS):
+        end = min(start + INSERT_CHUNK_ROWS, generated)
+        columns = [aggregated[col][start:end] for col in OUTPUT_COLUMNS]
+        if np is not None:
+            columns = [c.tolist() for c in columns]
+        yield from zip(repeat(symbol), *columns)
+        print(f"  Generated {end:,} {window}-minute klines...")
+
+
+def _load_klines(input_db: Path, symbol: str) -> dict:
+    """Load a symbol's 1-minute klines as one array (or list) per column.
+
+    Args:
+        input_db: Path to input SQLite database with 1-min klines.
+        symbol: Trading pair symbol to load.
+
+    Returns:
+        Mapping of OUTPUT_COLUMNS to values ordered by open_time.
+    """
+    input_conn = connect_input(input_db)
+
+    # Count first so the column arrays can be allocated once
+    expected = input_conn.execute(
+        "SELECT COUNT(*) FROM klines WHERE symbol = ? AND interval = '1m'",
+        (symbol,)
+    ).fetchone()[0]
+
+    # Query all 1-minute klines for the symbol, ordered by time
+    cursor = input_conn.execute(
+        """
+        SELECT open_time, open, high, low, close, volume, close_time, trades
+        FROM klines
+        WHERE symbol = ? AND interval = '1m'
+        ORDER BY open_time ASC
+        """,
+        (symbol,)
+    )
+
+    if np is not None:
+        rows = fetch_into_array(cursor, expected, KLINE_DTYPE)
+        klines = {col: np.ascontiguousarray(rows[col]) for col in OUTPUT_COLUMNS}
+    else:
+        rows = cursor.fetchall()
+        columns = zip(*rows) if rows else repeat((), len(OUTPUT_COLUMNS))
+        klines = {col: list(values) for col, values in zip(OUTPUT_COLUMNS, columns)}
+
+    input_conn.close()
+    return klines
+
+
+def _create_output_db(output_db: Path, window: int) -> sqlite3.Connection:
+    """Recreate the output database and return a tuned connection to it."""
+    # Delete existing output file if it exists
+    if output_db.exists():
+        print(f"Removing existing database: {output_db}")
+        output_db.unlink()
+    # A WAL left behind by an interrupted run must not be replayed into the new file
+    for suffix in ("-wal", "-shm"):
+        Path(f"{output_db}{suffix}").unlink(missing_ok=True)
+
+    # uri=True so the SQL path can ATTACH the input through a read-only URI
+    conn = sqlite3.connect(
+        output_db.resolve().as_uri(), uri=True, cached_statements=CACHED_STATEMENTS
+    )
+    for pragma in OUTPUT_PRAGMAS:
+        conn.execute(pragma)
+    conn.executescript(get_schema(window))
+    conn.commit()
+    return conn
+
+
 def generate_rolling_klines(
     input_db: Path,
     output_db: Path,
     symbol: str = "BTCUSDT",
     window: int = 3,
+    build_index: bool = True,
 ) -> tuple[int, int]:
     """Generate N-minute rolling klines from 1-minute data.
 
@@ -109,128 +472,228 @@ def generate_rolling_klines(
         output_db: Path to output SQLite database for N-min klines.
         symbol: Trading pair symbol to process.
         window: Rolling window size in minutes.
+        build_index: Build the unique index after loading (skipped for
+            per-symbol parts that are merged afterwards).
 
     Returns:
         Tuple of (total_1min_klines, generated_Nmin_klines).
     """
-    # Delete existing output file if it exists
-    if output_db.exists():
-        print(f"Removing existing database: {output_db}")
-        output_db.unlink()
-
-    # Connect to input database
-    input_conn = sqlite3.connect(str(input_db))
-    input_conn.row_factory = sqlite3.Row
-
     # Connect to output database and create schema
-    output_conn = sqlite3.connect(str(output_db))
-    output_conn.executescript(get_schema(window))
-    output_conn.commit()
+    output_conn = _create_output_db(output_db, window)
 
-    # Query all 1-minute klines for the symbol, ordered by time
-    cursor = input_conn.execute(
-        """
-        SELECT symbol, open_time, open, high, low, close, volume, close_time, trades
-        FROM klines
-        WHERE symbol = ? AND interval = '1m'
-        ORDER BY open_time ASC
-        """,
-        (symbol,)
-    )
-
-    # Load all klines into memory (for sliding window)
-    klines = [dict(row) for row in cursor.fetchall()]
-    total_1min = len(klines)
+    klines = _load_klines(input_db, symbol)
+    total_1min = len(klines["open"])
 
     if total_1min < window:
         print(f"Not enough 1-minute klines ({total_1min}) to generate {window}-minute klines")
-        input_conn.close()
         output_conn.close()
         return total_1min, 0
 
     print(f"Processing {total_1min:,} 1-minute klines for {symbol}...")
 
     # Generate N-minute klines using sliding window
-    generated = 0
-    batch = []
-    batch_size = 10000
+    aggregated = aggregate_klines(klines, window)
+    generated = len(aggregated["open"])
+    # One executemany streams every row from a generator inside one transaction,
+    # so the journal is synced once and no row list is ever materialized
+    output_conn.execute("BEGIN IMMEDIATE")
+    output_conn.executemany(
+        get_insert_sql(window), _iter_output_rows(aggregated, symbol, window)
+    )
+    output_conn.commit()
 
-    for i in range(len(klines) - window + 1):
-        kline_window = klines[i:i + window]
-        kline_nmin = aggregate_klines(kline_window, window)
+    if build_index:
+        print(f"  Building index on klines_{window}min...")
+        output_conn.executescript(get_post_load_sql(window))
 
-        if kline_nmin:
-            batch.append(kline_nmin)
-            generated += 1
+    output_conn.close()
 
-            if len(batch) >= batch_size:
-                _insert_batch(output_conn, batch, window)
-                batch = []
-                print(f"  Generated {generated:,} {window}-minute klines...")
+    return total_1min, generated
 
-    # Insert remaining batch
-    if batch:
-        _insert_batch(output_conn, batch, window)
 
-    input_conn.close()
+def generate_rolling_klines_sql(
+    input_db: Path,
+    output_db: Path,
+    symbol: str = "BTCUSDT",
+    window: int = 3,
+    build_index: bool = True,
+) -> tuple[int, int]:
+    """Generate N-minute rolling klines with SQLite window functions.
+
+    The input database is attached to the output connection and aggregated
+    with a single INSERT ... SELECT, so no rows pass through Python.
+    Requires SQLite 3.25+ for window functions.
+
+    Args:
+        input_db: Path to input SQLite database with 1-min klines.
+        output_db: Path to output SQLite database for N-min klines.
+        symbol: Trading pair symbol to process.
+        window: Rolling window size in minutes.
+        build_index: Build the unique index after loading (skipped for
+            per-symbol parts that are merged afterwards).
+
+    Returns:
+        Tuple of (total_1min_klines, generated_Nmin_klines).
+    """
+    output_conn = _create_output_db(output_db, window)
+    # Attach the input read-only with the same tuning as connect_input
+    output_conn.execute("ATTACH DATABASE ? AS src", (input_uri(input_db),))
+    for pragma in INPUT_PRAGMAS:
+        output_conn.execute(pragma.replace("PRAGMA ", "PRAGMA src.", 1))
+
+    total_1min = output_conn.execute(
+        "SELECT COUNT(*) FROM src.klines WHERE symbol = ? AND interval = '1m'",
+        (symbol,)
+    ).fetchone()[0]
+
+    if total_1min < window:
+        print(f"Not enough 1-minute klines ({total_1min}) to generate {window}-minute klines")
+        output_conn.close()
+        return total_1min, 0
+
+    print(f"Aggregating {total_1min:,} 1-minute klines for {symbol} in SQLite...")
+
+    output_conn.execute("BEGIN IMMEDIATE")
+    generated = output_conn.execute(get_window_insert_sql(window), (symbol,)).rowcount
+    output_conn.commit()
+    output_conn.execute("DETACH DATABASE src")
+
+    if build_index:
+        print(f"  Building index on klines_{window}min...")
+        output_conn.executescript(get_post_load_sql(window))
     output_conn.close()
 
     return total_1min, generated
 
 
-def _insert_batch(conn: sqlite3.Connection, klines: list[dict], window: int) -> None:
-    """Insert a batch of N-minute klines."""
-    conn.executemany(
-        f"""
-        INSERT OR REPLACE INTO klines_{window}min
-        (symbol, open_time, open, high, low, close, volume, close_time, trades)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        [
-            (
-                k["symbol"],
-                k["open_time"],
-                k["open"],
-                k["high"],
-                k["low"],
-                k["close"],
-                k["volume"],
-                k["close_time"],
-                k["trades"],
-            )
-            for k in klines
-        ]
-    )
-    conn.commit()
+def generate_rolling_klines_parquet(
+    input_db: Path,
+    parquet_path: Path,
+    symbol: str = "BTCUSDT",
+    window: int = 3,
+) -> tuple[int, int]:
+    """Generate N-minute rolling klines into a ZSTD-compressed Parquet file.
+
+    The aggregated columns are handed to Arrow as-is, with no per-row Python
+    objects, and the constant symbol column is dictionary-encoded. Readers can
+    then load only the columns they scan. Requires pyarrow; without numpy the
+    aggregated lists are converted instead.
+
+    Args:
+        input_db: Path to input SQLite database with 1-min klines.
+        parquet_path: Output Parquet file path (overwritten).
+        symbol: Trading pair symbol to process.
+        window: Rolling window size in minutes.
+
+    Returns:
+        Tuple of (total_1min_klines, generated_Nmin_klines).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    klines = _load_klines(input_db, symbol)
+    total_1min = len(klines["open"])
+
+    if total_1min < window:
+        print(f"Not enough 1-minute klines ({total_1min}) to generate {window}-minute klines")
+        return total_1min, 0
+
+    print(f"Processing {total_1min:,} 1-minute klines for {symbol}...")
+
+    aggregated = aggregate_klines(klines, window)
+    generated = len(aggregated["open"])
+
+    table = pa.table({
+        "symbol": pa.DictionaryArray.from_arrays(
+            pa.repeat(pa.scalar(0, pa.int32()), generated), pa.array([symbol])
+        ),
+        **{col: pa.array(aggregated[col]) for col in OUTPUT_COLUMNS},
+    })
+    pq.write_table(table, str(parquet_path), compression="zstd")
+
+    return total_1min, generated
+
+
+def generate_rolling_klines_multi(
+    input_db: Path,
+    output_db: Path,
+    symbols: list[str],
+    window: int = 3,
+    workers: Optional[int] = None,
+    use_sql: bool = False,
+) -> dict[str, tuple[int, int]]:
+    """Generate N-minute rolling klines for several symbols in parallel.
+
+    Each symbol is aggregated in its own process into a temporary database
+    next to the output (so no two processes write the same file). The parts
+    are then merged into the output with INSERT ... SELECT and indexed once.
+
+    Args:
+        input_db: Path to input SQLite database with 1-min klines.
+        output_db: Path to output SQLite database for N-min klines.
+        symbols: Trading pair symbols to process.
+        window: Rolling window size in minutes.
+        workers: Worker processes (default: one per symbol, up to CPU count).
+        use_sql: Aggregate with SQLite window functions instead of NumPy.
+
+    Returns:
+        Mapping of symbol to (total_1min_klines, generated_Nmin_klines).
+    """
+    generate = generate_rolling_klines_sql if use_sql else generate_rolling_klines
+    workers = workers or min(len(symbols), os.cpu_count() or 1)
+    output_db.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(dir=output_db.parent) as tmp_dir:
+        parts = {symbol: Path(tmp_dir) / f"{symbol}.db" for symbol in symbols}
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                symbol: pool.submit(
+                    generate, input_db, part, symbol, window, build_index=False
+                )
+                for symbol, part in parts.items()
+            }
+            results = {symbol: future.result() for symbol, future in futures.items()}
+
+        print(f"Merging {len(parts)} symbols into {output_db}...")
+        output_conn = _create_output_db(output_db, window)
+        # Same text for every part, so it is prepared once and reused from the cache
+        merge_sql = f"INSERT INTO klines_{window}min SELECT * FROM part.klines_{window}min"
+        for symbol, part in parts.items():
+            if not results[symbol][1]:
+                continue
+            output_conn.execute("ATTACH DATABASE ? AS part", (str(part),))
+            output_conn.execute("BEGIN IMMEDIATE")
+            output_conn.execute(merge_sql)
+            output_conn.commit()
+            output_conn.execute("DETACH DATABASE part")
+
+        print(f"  Building index on klines_{window}min...")
+        output_conn.executescript(get_post_load_sql(window))
+        output_conn.close()
+
+    return results
 
 
 def get_stats(db_path: Path, symbol: str, window: int) -> dict:
     """Get statistics for N-minute klines in database."""
     conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-
-    cursor = conn.execute(
-        f"SELECT COUNT(*) as count FROM klines_{window}min WHERE symbol = ?",
-        (symbol,)
-    )
-    count = cursor.fetchone()["count"]
 
-    cursor = conn.execute(
+    count, min_time, max_time = conn.execute(
         f"""
-        SELECT MIN(open_time) as min_time, MAX(open_time) as max_time
+        SELECT COUNT(*), MIN(open_time), MAX(open_time)
         FROM klines_{window}min WHERE symbol = ?
         """,
         (symbol,)
-    )
-    row = cursor.fetchone()
+    ).fetchone()
 
     conn.close()
 
     return {
         "symbol": symbol,
         "count": count,
-        "min_time": row["min_time"],
-        "max_time": row["max_time"],
+        "min_time": min_time,
+        "max_time": max_time,
     }
 
 
@@ -262,12 +725,41 @@ def main():
         default=None,
         help="Output SQLite database path (default: binance_rolling_{N}min_klines.db)",
     )
+    parser.add_argument(
+        "--symbols",
+        type=str,
+        default=None,
+        help="Comma-separated symbols to process in parallel (overrides --symbol)",
+    )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for --symbols (default: one per symbol, up to CPU count)",
+    )
+    parser.add_argument(
+        "--sql",
+        action="store_true",
+        help="Aggregate inside SQLite with window functions instead of in Python",
+    )
+    parser.add_argument(
+        "--parquet",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write a Parquet file instead of an SQLite database (single symbol)",
+    )
     args = parser.parse_args()
 
+    if args.parquet and (args.sql or args.symbols):
+        parser.error("--parquet cannot be combined with --sql or --symbols")
+
     input_db = Path(args.input) if args.input else DEFAULT_INPUT_DB
     output_db = Path(args.output) if args.output else (
         Path(__file__).parent.parent / f"binance_rolling_{args.window}min_klines.db"
     )
+    if args.parquet:
+        output_db = Path(args.parquet)
 
     if not input_db.exists():
         print(f"Error: Input database not found: {input_db}")
@@ -279,25 +771,37 @@ def main():
     print("=" * 60)
     print(f"Input:  {input_db}")
     print(f"Output: {output_db}")
-    print(f"Symbol: {args.symbol}")
+    symbols = [sym.strip() for sym in args.symbols.split(",")] if args.symbols else [args.symbol]
+    print(f"Symbol: {', '.join(symbols)}")
     print(f"Window: {args.window} minutes")
     print()
 
-    total_1min, generated = generate_rolling_klines(
-        input_db, output_db, args.symbol, args.window
-    )
+    if args.parquet:
+        results = {symbols[0]: generate_rolling_klines_parquet(
+            input_db, output_db, symbols[0], args.window
+        )}
+    elif len(symbols) > 1:
+        results = generate_rolling_klines_multi(
+            input_db, output_db, symbols, args.window, args.workers, use_sql=args.sql
+        )
+    else:
+        generate = generate_rolling_klines_sql if args.sql else generate_rolling_klines
+        results = {symbols[0]: generate(input_db, output_db, symbols[0], args.window)}
 
     print()
     print("=" * 60)
     print("RESULTS")
     print("=" * 60)
-    print(f"1-minute klines processed: {total_1min:,}")
-    print(f"{args.window}-minute klines generated: {generated:,}")
-
-    if generated > 0:
-        stats = get_stats(output_db, args.symbol, args.window)
-        print(f"\nDatabase stats:")
-        print(f"  Total {args.window}-min klines: {stats['count']:,}")
+    for symbol, (total_1min, generated) in results.items():
+        if len(results) > 1:
+            print(f"{symbol}:")
+        print(f"1-minute klines processed: {total_1min:,}")
+        print(f"{args.window}-minute klines generated: {generated:,}")
+
+        if generated > 0 and not args.parquet:
+            stats = get_stats(output_db, symbol, args.window)
+            print(f"\nDatabase stats:")
+            print(f"  Total {args.window}-min klines: {stats['count']:,}")
 
     return 0
 
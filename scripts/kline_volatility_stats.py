@@ -77,75 +77,80 @@ USAGE
 """
 
 import argparse
-import math
-import sqlite3
 from pathlib import Path
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Sibling script (scripts/ is on sys.path when run directly); one copy of the
+# read-only input connection and the cursor-to-array fill
+from generate_rolling_klines import connect_input, fetch_into_array
+
 DEFAULT_DB = Path(__file__).parent.parent / "binance_klines.db"
 
+# Row layout of the 1-minute query, read straight from the cursor into NumPy
+# (float64: log prices are differenced, so they need full precision)
+OHLC_DTYPE = np.dtype([(col, np.float64) for col in ("open", "high", "low", "close")])
 
-def calc_stats(values: list[float]) -> dict:
-    """Calculate statistics for a list of values."""
-    if not values:
-        return {}
 
-    sorted_vals = sorted(values)
-    n = len(sorted_vals)
-    mean = sum(values) / n
-    median = sorted_vals[n // 2]
+def calc_stats(values: np.ndarray) -> dict:
+    """Calculate statistics for an array of values.
 
-    # Standard deviation
-    variance = sum((x - mean) ** 2 for x in values) / n
-    std = math.sqrt(variance)
+    Percentiles use the same ``int(n * p)`` order-statistic positions as a
+    full sort would, but are selected with a single ``np.partition`` call.
+    Values may be float32; mean and std are still accumulated in float64.
+    """
+    if len(values) == 0:
+        return {}
 
-    # Percentiles
-    p5 = sorted_vals[int(n * 0.05)]
-    p25 = sorted_vals[int(n * 0.25)]
-    p66 = sorted_vals[int(n * 0.66)]
-    p75 = sorted_vals[int(n * 0.75)]
-    p95 = sorted_vals[int(n * 0.95)]
-    p99 = sorted_vals[int(n * 0.99)]
+    values = np.asarray(values)
+    n = len(values)
+
+    positions = {
+        "median": n // 2,
+        "p5": int(n * 0.05),
+        "p25": int(n * 0.25),
+        "p66": int(n * 0.66),
+        "p75": int(n * 0.75),
+        "p95": int(n * 0.95),
+        "p99": int(n * 0.99),
+    }
+    partitioned = np.partition(values, sorted(set(positions.values())))
 
     return {
         "count": n,
-        "mean": mean,
-        "median": median,
-        "std": std,
-        "min": sorted_vals[0],
-        "max": sorted_vals[-1],
-        "p5": p5,
-        "p25": p25,
-        "p66": p66,
-        "p75": p75,
-        "p95": p95,
-        "p99": p99,
+        # Accumulate in float64 even when the values are float32
+        "mean": float(values.mean(dtype=np.float64)),
+        "std": float(values.std(dtype=np.float64)),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        **{name: float(partitioned[pos]) for name, pos in positions.items()},
     }
 
 
-def aggregate_klines(klines: list[dict], window: int) -> list[dict]:
-    """Aggregate 1-minute klines into rolling N-minute klines.
+def aggregate_klines(klines: dict[str, np.ndarray], window: int) -> dict[str, np.ndarray]:
+    """Aggregate 1-minute kline columns into rolling N-minute kline columns.
+
+    Works on raw or log prices alike, since max/min commute with log.
 
     Args:
-        klines: List of 1-minute kline dicts with open/high/low/close.
+        klines: Mapping of open/high/low/close to 1-D arrays of 1-minute values.
         window: Number of minutes to aggregate.
 
     Returns:
-        List of aggregated klines.
+        Mapping of open/high/low/close to aggregated values
+        (empty arrays if there are fewer than ``window`` klines).
     """
-    if len(klines) < window:
-        return []
-
-    result = []
-    for i in range(len(klines) - window + 1):
-        w = klines[i:i + window]
-        result.append({
-            "open": w[0]["open"],
-            "high": max(k["high"] for k in w),
-            "low": min(k["low"] for k in w),
-            "close": w[-1]["close"],
-        })
+    n = len(klines["open"])
+    if n < window:
+        return {col: klines[col][:0] for col in OHLC_DTYPE.names}
 
-    return result
+    return {
+        "open": klines["open"][:n - window + 1],
+        "high": sliding_window_view(klines["high"], window).max(axis=1),
+        "low": sliding_window_view(klines["low"], window).min(axis=1),
+        "close": klines["close"][window - 1:],
+    }
 
 
 def main():
@@ -161,8 +166,13 @@ def main():
         print(f"Error: Database not found: {db_path}")
         return 1
 
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    conn = connect_input(db_path)
+
+    # Count first so the column arrays can be allocated once
+    expected = conn.execute(
+        "SELECT COUNT(*) FROM klines WHERE symbol = ? AND interval = '1m'",
+        (args.symbol,)
+    ).fetchone()[0]
 
     # Query all 1-minute klines
     cursor = conn.execute(
@@ -175,57 +185,63 @@ def main():
         (args.symbol,)
     )
 
-    klines_1m = [dict(row) for row in cursor.fetchall()]
+    rows = fetch_into_array(cursor, expected, OHLC_DTYPE)
     conn.close()
+    klines_1m = {col: np.ascontiguousarray(rows[col]) for col in OHLC_DTYPE.names}
+    del rows
+    total_1min = len(klines_1m["open"])
 
-    if len(klines_1m) < args.window:
+    if total_1min < args.window:
         print(f"Not enough data (need at least {args.window} klines)")
         return 1
 
     print("=" * 70)
     print(f"VOLATILITY ANALYSIS - {args.symbol} {args.window}-MINUTE ROLLING KLINES")
     print("=" * 70)
-    print(f"1-minute klines: {len(klines_1m):,}")
-
-    # Generate rolling klines
-    klines = aggregate_klines(klines_1m, args.window)
-    print(f"{args.window}-minute klines: {len(klines):,}")
+    print(f"1-minute klines: {total_1min:,}")
+
+    # Take logs once on the 1-minute series. log is monotonic, so the rolling
+    # max/min of log prices are the logs of the rolling high/low, and the
+    # windowed open/close are plain slices; every ratio below is a difference.
+    # Non-positive prices become -inf/NaN and are masked out per metric.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_1m = {col: np.log(values) for col, values in klines_1m.items()}
+
+    # Generate rolling klines (in log-price space)
+    klines = aggregate_klines(log_1m, args.window)
+    print(f"{args.window}-minute klines: {len(klines['open']):,}")
     print()
 
-    # Calculate log returns
-    intra_range = []      # log(high/low)
-    open_to_close = []    # log(close/open)
-    close_to_close = []   # log(close_t / close_{t-1})
-    open_to_high = []     # log(open/high) - always <= 0
-    open_to_low = []      # log(open/low) - always >= 0
-    max_excursion = []    # max(|log(O/H)|, |log(O/L)|) - max move from open
-
-    prev_close = None
-    for k in klines:
-        # Intra-candle range
-        if k["high"] > 0 and k["low"] > 0:
-            intra_range.append(math.log(k["high"] / k["low"]))
-
-        # Open to close
-        if k["close"] > 0 and k["open"] > 0:
-            open_to_close.append(math.log(k["close"] / k["open"]))
-
-        # Close to close (consecutive)
-        if prev_close and k["close"] > 0:
-            close_to_close.append(math.log(k["close"] / prev_close))
-
-        # Open to high and low (extremes)
-        if k["open"] > 0 and k["high"] > 0 and k["low"] > 0:
-            o_to_h = math.log(k["open"] / k["high"])  # <= 0
-            o_to_l = math.log(k["open"] / k["low"])   # >= 0
-            open_to_high.append(o_to_h)
-            open_to_low.append(o_to_l)
-            max_excursion.append(max(abs(o_to_h), abs(o_to_l)))
-
-        prev_close = k["close"]
+    # Calculate log returns (each metric skips candles with non-positive prices)
+    log_o, log_h, log_l, log_c = klines["open"], klines["high"], klines["low"], klines["close"]
+    o_ok, h_ok, l_ok, c_ok = (np.isfinite(x) for x in (log_o, log_h, log_l, log_c))
+
+    # Intra-candle range: log(high/low)
+    hl_ok = h_ok & l_ok
+    intra_range = (log_h - log_l)[hl_ok]
+
+    # Open to close: log(close/open)
+    open_to_close = (log_c - log_o)[c_ok & o_ok]
+
+    # Close to close (consecutive): log(close_t / close_{t-1})
+    close_to_close = np.diff(log_c)[c_ok[:-1] & c_ok[1:]]
+
+    # Open to high and low (extremes)
+    ext_ok = o_ok & hl_ok
+    open_to_high = (log_o - log_h)[ext_ok]  # <= 0
+    open_to_low = (log_o - log_l)[ext_ok]   # >= 0
+
+    # Log prices need float64 (they are ~10 and the returns ~1e-4 differences of
+    # them), but the returns themselves fit float32, which halves the memory
+    # traffic of the abs/maximum/partition passes below
+    intra_range, open_to_close, close_to_close, open_to_high, open_to_low = (
+        x.astype(np.float32)
+        for x in (intra_range, open_to_close, close_to_close, open_to_high, open_to_low)
+    )
+    max_excursion = np.maximum(np.abs(open_to_high), np.abs(open_to_low))
 
     # Calculate and print statistics
-    def print_stats(name: str, values: list[float], multiplier: float = 100):
+    def print_stats(name: str, values: np.ndarray, multiplier: float = 100):
         """Print statistics, converting to percentage."""
         stats = calc_stats(values)
         if not stats:
@@ -266,10 +282,10 @@ def main():
     print_stats("5. OPEN-TO-LOW: log(open/low)", open_to_low)
 
     # Absolute returns for volatility measure
-    abs_otc = [abs(x) for x in open_to_close]
-    abs_ctc = [abs(x) for x in close_to_close]
-    abs_oth = [abs(x) for x in open_to_high]
-    abs_otl = [abs(x) for x in open_to_low]
+    abs_otc = np.abs(open_to_close)
+    abs_ctc = np.abs(close_to_close)
+    abs_oth = np.abs(open_to_high)
+    abs_otl = np.abs(open_to_low)
 
     print("=" * 70)
     print("ABSOLUTE RETURNS (for volatility measurement)")
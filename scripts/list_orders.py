@@ -20,34 +20,40 @@ Requirements:
 import argparse
 import asyncio
 import sys
+import time
 from datetime import datetime, timezone
+from typing import Optional
 
 sys.path.insert(0, "src")
 
 from poly import PolymarketAPI, PolymarketConfig, OrderSide
-from poly.api.signer import LocalSigner
 
+# Order timestamp display format (UTC)
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
 
-def get_open_orders(config: PolymarketConfig) -> list[dict]:
+# Max in-flight cancel/sell requests for the "all" commands (Polymarket rate limits)
+BULK_CONCURRENCY = 10
+
+# Prefetched best bids older than this are refetched before selling (seconds)
+BID_MAX_AGE = 5.0
+
+
+def get_open_orders(api: PolymarketAPI) -> list[dict]:
     """Fetch all open orders for the configured wallet using py-clob-client.
 
+    Uses the API's own CLOB client, so the API credentials derived here are
+    reused by later cancels instead of being derived a second time.
+
     Args:
-        config: Polymarket configuration with credentials
+        api: Polymarket API client with trading credentials
 
     Returns:
         List of open order dictionaries
     """
-    if not config.private_key:
-        raise ValueError("Private key required to fetch orders")
+    client = api._get_clob_client()
 
-    signer = LocalSigner(private_key=config.private_key)
-    client = signer._get_clob_client()
-
-    # Fetch open orders (LIVE state)
-    orders = client.get_orders()
-
-    # Filter to only LIVE orders
-    return [o for o in orders if o.get("status") == "LIVE" or o.get("state") == "LIVE"]
+    # Fetch and keep orders LIVE in either field, in a single pass
+    return [o for o in client.get_orders() if "LIVE" in (o.get("status"), o.get("state"))]
 
 
 def format_order(order: dict, index: int) -> str:
@@ -72,9 +78,8 @@ def format_order(order: dict, index: int) -> str:
     # Try to parse timestamp
     if isinstance(created, (int, float)):
         try:
-            dt = datetime.fromtimestamp(created / 1000, tz=timezone.utc)
-            created = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, OSError):
+            created = time.strftime(_TS_FMT, time.gmtime(created / 1000))
+        except (ValueError, OSError, OverflowError):
             pass
 
     lines = [
@@ -205,12 +210,44 @@ async def sell_position(api: PolymarketAPI, pos, price: float = None, market_ord
         return False
 
 
-async def interactive_sell(api: PolymarketAPI, positions: list) -> int:
+async def prefetch_best_bids(
+    api: PolymarketAPI, positions: list
+) -> dict[str, tuple[float, float]]:
+    """Fetch the best bid for every position's token concurrently.
+
+    Args:
+        api: Polymarket API client
+        positions: List of MarketPosition objects
+
+    Returns:
+        Mapping of token ID to (best bid or 0 if no bids, time.monotonic()
+        at fetch)
+    """
+    sem = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def best_bid(token_id: str) -> tuple[float, float]:
+        async with sem:
+            bid = await get_orderbook_price(api, token_id, "bid")
+        return bid, time.monotonic()
+
+    tokens = list(dict.fromkeys(p.asset for p in positions))
+    bids = await asyncio.gather(*(best_bid(t) for t in tokens))
+    return dict(zip(tokens, bids))
+
+
+async def interactive_sell(
+    api: PolymarketAPI,
+    positions: list,
+    best_bids: Optional[dict[str, tuple[float, float]]] = None,
+) -> int:
     """Interactive mode to sell positions.
 
     Args:
         api: Polymarket API client
         positions: List of MarketPosition objects
+        best_bids: Prefetched (best bid, fetch time) per token; a bid younger
+            than BID_MAX_AGE is used as the limit price, otherwise the
+            orderbook is fetched again when a position is picked
 
     Returns:
         Number of positions sold
@@ -234,10 +271,15 @@ async def interactive_sell(api: PolymarketAPI, positions: list) -> int:
 
         if choice == "a":
             print("\nSelling all positions as market orders...")
-            for pos in positions:
-                print(f"  Selling {pos.size:.2f} {pos.outcome} shares of {pos.title[:30]}...")
-                if await sell_position(api, pos, market_order=True):
-                    sold += 1
+            sem = asyncio.Semaphore(BULK_CONCURRENCY)
+
+            async def sell_one(pos) -> bool:
+                async with sem:
+                    print(f"  Selling {pos.size:.2f} {pos.outcome} shares of {pos.title[:30]}...")
+                    return await sell_position(api, pos, market_order=True)
+
+            results = await asyncio.gather(*(sell_one(pos) for pos in positions))
+            sold += sum(results)
             break
 
         try:
@@ -245,7 +287,12 @@ async def interactive_sell(api: PolymarketAPI, positions: list) -> int:
             if 1 <= idx <= len(positions):
                 pos = positions[idx - 1]
                 print(f"  Selling {pos.size:.2f} {pos.outcome} shares...")
-                if await sell_position(api, pos):
+                bid, fetched_at = (best_bids or {}).get(pos.asset, (0.0, 0.0))
+                fresh = time.monotonic() - fetched_at <= BID_MAX_AGE
+                price = bid if bid and fresh else None
+                if price is not None:
+                    print(f"    Using best bid: {price:.4f} (prefetched)")
+                if await sell_position(api, pos, price=price):
                     sold += 1
                     positions.pop(idx - 1)
                     if not positions:
@@ -266,9 +313,13 @@ async def interactive_sell(api: PolymarketAPI, positions: list) -> int:
 async def interactive_cancel(api: PolymarketAPI, orders: list[dict]) -> int:
     """Interactive mode to cancel orders.
 
+    Works on the in-memory ``orders`` list fetched by the caller; cancelled
+    orders are removed locally and the API is only queried again when the
+    user enters 'r' to refresh.
+
     Args:
         api: Polymarket API client
-        orders: List of open orders
+        orders: List of open orders (updated in place)
 
     Returns:
         Number of orders cancelled
@@ -277,7 +328,7 @@ async def interactive_cancel(api: PolymarketAPI, orders: list[dict]) -> int:
         print("\nNo open orders to cancel.")
         return 0
 
-    print("\nEnter order number to cancel (or 'q' to quit, 'a' to cancel all):")
+    print("\nEnter order number to cancel (or 'q' to quit, 'a' to cancel all, 'r' to refresh):")
 
     cancelled = 0
     while True:
@@ -292,17 +343,34 @@ async def interactive_cancel(api: PolymarketAPI, orders: list[dict]) -> int:
 
         if choice == "a":
             print("\nCancelling all orders...")
-            for order in orders:
-                order_id = order.get("id")
-                if order_id:
-                    print(f"  Cancelling {order_id[:20]}...", end=" ")
-                    if await cancel_order_by_id(api, order_id):
-                        print("[OK]")
-                        cancelled += 1
-                    else:
-                        print("[FAILED]")
+            sem = asyncio.Semaphore(BULK_CONCURRENCY)
+
+            async def cancel_one(order_id: str) -> bool:
+                async with sem:
+                    ok = await cancel_order_by_id(api, order_id)
+                print(f"  Cancelling {order_id[:20]}... {'[OK]' if ok else '[FAILED]'}")
+                return ok
+
+            results = await asyncio.gather(
+                *(cancel_one(order["id"]) for order in orders if order.get("id"))
+            )
+            cancelled += sum(results)
             break
 
+        if choice == "r":
+            try:
+                orders[:] = get_open_orders(api)
+            except Exception as e:
+                print(f"  [ERROR] Refresh failed: {e}")
+                continue
+            if not orders:
+                print("\nNo open orders.")
+                break
+            print(f"\nOpen orders ({len(orders)}):")
+            for i, o in enumerate(orders, 1):
+                print(format_order(o, i))
+            continue
+
         try:
             idx = int(choice)
             if 1 <= idx <= len(orders):
@@ -321,13 +389,13 @@ async def interactive_cancel(api: PolymarketAPI, orders: list[dict]) -> int:
                         print("\nRemaining orders:")
                         for i, o in enumerate(orders, 1):
                             print(format_order(o, i))
-                        print("\nEnter order number to cancel (or 'q' to quit):")
+                        print("\nEnter order number to cancel (or 'q' to quit, 'r' to refresh):")
                     else:
                         print("[FAILED]")
             else:
-                print(f"Invalid selection. Enter 1-{len(orders)}, 'a' for all, or 'q' to quit.")
+                print(f"Invalid selection. Enter 1-{len(orders)}, 'a' for all, 'r' to refresh, or 'q' to quit.")
         except ValueError:
-            print("Invalid input. Enter a number, 'a' for all, or 'q' to quit.")
+            print("Invalid input. Enter a number, 'a' for all, 'r' to refresh, or 'q' to quit.")
 
     return cancelled
 
@@ -364,26 +432,22 @@ async def main_async(args: argparse.Namespace) -> int:
         print("    Set POLYMARKET_PRIVATE_KEY environment variable")
         return 1
 
-    # Cancel specific order by ID if provided
-    if args.cancel_id:
-        order_id = args.cancel_id
-        print(f"\n[2] Cancelling order: {order_id}")
+    # One client (and one pooled HTTP session) serves every phase below
+    async with PolymarketAPI(config) as api:
+        # Cancel specific order by ID if provided
+        if args.cancel_id:
+            order_id = args.cancel_id
+            print(f"\n[2] Cancelling order: {order_id}")
 
-        api = PolymarketAPI(config)
-        try:
             if await cancel_order_by_id(api, order_id):
                 print("    [OK] Order cancelled successfully")
                 return 0
             else:
                 return 1
-        finally:
-            await api.close()
 
-    # Show positions mode
-    if show_positions:
-        print("\n[2] Fetching positions...")
-        api = PolymarketAPI(config)
-        try:
+        # Show positions mode
+        if show_positions:
+            print("\n[2] Fetching positions...")
             positions = await api.get_positions(size_threshold=0.01)
             print(f"    Found {len(positions)} position(s)")
 
@@ -407,49 +471,43 @@ async def main_async(args: argparse.Namespace) -> int:
 
             # Interactive sell mode
             if args.sell:
-                sold = await interactive_sell(api, list(positions))
+                best_bids = await prefetch_best_bids(api, positions)
+                sold = await interactive_sell(api, list(positions), best_bids)
                 print(f"\nPlaced {sold} sell order(s)")
 
-        finally:
-            await api.close()
-
-        return 0
-
-    # Show orders mode (default)
-    print("\n[2] Fetching open orders...")
+            return 0
 
-    try:
-        orders = get_open_orders(config)
-        print(f"    Found {len(orders)} open order(s)")
-    except Exception as e:
-        print(f"    [ERROR] {e}")
-        return 1
+        # Show orders mode (default)
+        print("\n[2] Fetching open orders...")
 
-    if not orders:
-        print("\n    No open orders.")
-        return 0
+        try:
+            orders = get_open_orders(api)
+            print(f"    Found {len(orders)} open order(s)")
+        except Exception as e:
+            print(f"    [ERROR] {e}")
+            return 1
+
+        if not orders:
+            print("\n    No open orders.")
+            return 0
+
+        # Display orders
+        print("\n" + "=" * 60)
+        print("OPEN ORDERS")
+        print("=" * 60)
+        for i, order in enumerate(orders, 1):
+            print()
+            print(format_order(order, i))
 
-    # Display orders
-    print("\n" + "=" * 60)
-    print("OPEN ORDERS")
-    print("=" * 60)
-    for i, order in enumerate(orders, 1):
         print()
-        print(format_order(order, i))
+        print(f"Total: {len(orders)} order(s)")
 
-    print()
-    print(f"Total: {len(orders)} order(s)")
-
-    # Interactive cancel mode
-    if args.cancel:
-        api = PolymarketAPI(config)
-        try:
+        # Interactive cancel mode
+        if args.cancel:
             cancelled = await interactive_cancel(api, orders)
             print(f"\nCancelled {cancelled} order(s)")
-        finally:
-            await api.close()
 
-    return 0
+        return 0
 
 
 def main():
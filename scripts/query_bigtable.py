@@ -15,15 +15,37 @@ Examples:
 import argparse
 import json
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from google.cloud import bigtable
+from google.cloud.bigtable import row_filters
 
 from poly.bigtable_status import check_collection_status, print_status
+from poly.storage.bigtable import decode_orderbook
+
+# Snapshot timestamp display format (UTC)
+_TS_FMT = "%Y-%m-%d %H:%M:%S UTC"
+
+# Plain-text snapshot columns decoded once per row
+WANTED = frozenset((b"ts", b"market_id", b"spot_price"))
+
+# Snapshot columns displayed by query_snapshots; everything else stays server-side
+SNAPSHOT_QUALIFIERS = (*sorted(WANTED), b"orderbook")
+
+# Latest cell of the displayed columns only
+SNAPSHOT_FILTER = row_filters.RowFilterChain(
+    filters=[
+        row_filters.FamilyNameRegexFilter("data"),
+        row_filters.ColumnQualifierRegexFilter(
+            b"^(" + b"|".join(SNAPSHOT_QUALIFIERS) + b")$"
+        ),
+        row_filters.CellsColumnLimitFilter(1),
+    ]
+)
 
 
 def query_snapshots(
@@ -33,7 +55,8 @@ def query_snapshots(
     count: int = 5,
 ):
     """Query latest snapshots from Bigtable."""
-    client = bigtable.Client(project=project_id, admin=True)
+    # Data-plane reads only; admin access is reserved for list_tables
+    client = bigtable.Client(project=project_id)
     instance = client.instance(instance_id)
     table = instance.table(table_name)
 
@@ -42,22 +65,23 @@ def query_snapshots(
 
     # Read rows (newest first due to inverted timestamp)
     row_count = 0
-    for row in table.read_rows(limit=count):
+    for row in table.read_rows(limit=count, filter_=SNAPSHOT_FILTER):
         row_count += 1
         cells = row.cells.get("data", {})
 
         # Extract values
-        def get_val(key: bytes) -> str:
-            if key in cells:
-                return cells[key][0].value.decode()
-            return "N/A"
-
-        ts = float(get_val(b"ts")) if get_val(b"ts") != "N/A" else 0
-        dt = datetime.fromtimestamp(ts, tz=timezone.utc) if ts else None
+        vals = {k: cells[k][0].value.decode() for k in WANTED if k in cells}
+        ts_str = vals.get(b"ts")
+        ts = float(ts_str) if ts_str else 0
+        time_str = time.strftime(_TS_FMT, time.gmtime(ts)) if ts else "N/A"
 
         # Parse orderbook JSON to get best bid/ask
         yes_bid, yes_ask, no_bid, no_ask = "N/A", "N/A", "N/A", "N/A"
-        orderbook_str = get_val(b"orderbook")
+        orderbook_str = (
+            decode_orderbook(cells[b"orderbook"][0].value)
+            if b"orderbook" in cells
+            else "N/A"
+        )
         if orderbook_str != "N/A":
             try:
                 ob = json.loads(orderbook_str)
@@ -92,9 +116,10 @@ def query_snapshots(
             except (json.JSONDecodeError, KeyError, TypeError):
                 pass
 
-        print(f"[{row_count}] {get_val(b'market_id')}")
-        print(f"    Time:      {dt.strftime('%Y-%m-%d %H:%M:%S UTC') if dt else 'N/A'}")
-        print(f"    Spot Price: ${float(get_val(b'spot_price')):,.2f}" if get_val(b"spot_price") != "N/A" else "    Spot Price: N/A")
+        spot_str = vals.get(b"spot_price")
+        print(f"[{row_count}] {vals.get(b'market_id', 'N/A')}")
+        print(f"    Time:      {time_str}")
+        print(f"    Spot Price: ${float(spot_str):,.2f}" if spot_str else "    Spot Price: N/A")
         print(f"    YES:       bid={yes_bid} / ask={yes_ask}  (depth: {yes_bid_depth:,.0f} / {yes_ask_depth:,.0f})")
         print(f"    NO:        bid={no_bid} / ask={no_ask}  (depth: {no_bid_depth:,.0f} / {no_ask_depth:,.0f})")
 
@@ -65,6 +65,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from google.cloud import bigtable
 import json
 
+from poly.storage.bigtable import decode_orderbook
+
 
 @dataclass
 class MarketAnalysis:
@@ -225,7 +227,11 @@ def query_all_markets(
         markets[market_id].append({
             "ts": float(get_val(b"ts") or 0),
             "market_id": market_id,
-            "orderbook": get_val(b"orderbook") or "{}",
+            "orderbook": (
+                decode_orderbook(cells[b"orderbook"][0].value)
+                if b"orderbook" in cells
+                else ""
+            ) or "{}",
             "spot_price": float(get_val(b"spot_price") or 0),
         })
 
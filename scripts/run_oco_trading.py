@@ -257,20 +257,24 @@ async def fetch_epoch_open_price(
         table_name = TABLE_BTC_15M if asset == Asset.BTC else TABLE_ETH_15M
         epoch_start_sec = epoch_start_ms / 1000
 
-        with BigtableWriter() as bt:
-            # Query snapshots around epoch start (within 60 seconds)
-            snapshots = bt.get_snapshots(
-                start_ts=epoch_start_sec - 5,
-                end_ts=epoch_start_sec + 60,
-                limit=10,
-                table_name=table_name,
-            )
+        def query_snapshots() -> list[dict]:
+            with BigtableWriter() as bt:
+                # Query snapshots around epoch start (within 60 seconds)
+                return bt.get_snapshots(
+                    start_ts=epoch_start_sec - 5,
+                    end_ts=epoch_start_sec + 60,
+                    limit=10,
+                    table_name=table_name,
+                )
+
+        # Bigtable client is sync; keep it off the event loop
+        snapshots = await asyncio.to_thread(query_snapshots)
 
-            if snapshots:
-                # Find the snapshot closest to epoch start
-                closest = min(snapshots, key=lambda s: abs(s["ts"] - epoch_start_sec))
-                if closest.get("spot_price"):
-                    return float(closest["spot_price"]), "bigtable"
+        if snapshots:
+            # Find the snapshot closest to epoch start
+            closest = min(snapshots, key=lambda s: abs(s["ts"] - epoch_start_sec))
+            if closest.get("spot_price"):
+                return float(closest["spot_price"]), "bigtable"
     except Exception as e:
         print(f"    [WARN] Bigtable fetch failed: {e}")
 
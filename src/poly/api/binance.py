@@ -1,6 +1,7 @@
 """Binance price fetching utilities (no API key required for public endpoints)."""
 
 import asyncio
+import json
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
@@ -106,71 +107,114 @@ class Kline:
         return self.high - self.low
 
 
-async def get_price(symbol: str = BTCUSDT) -> Optional[TickerPrice]:
+async def get_price(
+    symbol: str = BTCUSDT,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Optional[TickerPrice]:
     """Get current price for a symbol.
 
     Args:
         symbol: Trading pair symbol (e.g., 'BTCUSDT', 'ETHUSDT').
+        session: Optional shared aiohttp session (reuses pooled connections).
 
     Returns:
         TickerPrice object or None if failed.
     """
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await get_price(symbol, own_session)
+
     url = f"{BINANCE_API_BASE}/ticker/price?symbol={symbol}"
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            if response.status != 200:
-                return None
+    async with session.get(url) as response:
+        if response.status != 200:
+            return None
 
-            data = await response.json()
-            return TickerPrice(
-                symbol=data["symbol"],
-                price=Decimal(data["price"]),
-            )
+        data = await response.json()
+        return TickerPrice(
+            symbol=data["symbol"],
+            price=Decimal(data["price"]),
+        )
 
 
-async def get_btc_price() -> Optional[Decimal]:
+async def get_btc_price(
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Optional[Decimal]:
     """Get current BTC/USDT price.
 
+    Args:
+        session: Optional shared aiohttp session.
+
     Returns:
         BTC price in USDT or None if failed.
     """
-    ticker = await get_price(BTCUSDT)
+    ticker = await get_price(BTCUSDT, session)
     return ticker.price if ticker else None
 
 
-async def get_eth_price() -> Optional[Decimal]:
+async def get_eth_price(
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Optional[Decimal]:
     """Get current ETH/USDT price.
 
+    Args:
+        session: Optional shared aiohttp session.
+
     Returns:
         ETH price in USDT or None if failed.
     """
-    ticker = await get_price(ETHUSDT)
+    ticker = await get_price(ETHUSDT, session)
     return ticker.price if ticker else None
 
 
-async def get_prices(*symbols: str) -> dict[str, Decimal]:
-    """Get prices for multiple symbols concurrently.
+async def get_prices(
+    *symbols: str,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> dict[str, Decimal]:
+    """Get prices for multiple symbols in one batched request.
+
+    Binance rejects the whole batch (HTTP 400) if any symbol is invalid;
+    in that case each symbol is re-requested individually so only the bad
+    ones are dropped.
 
     Args:
         symbols: Trading pair symbols.
+        session: Optional shared aiohttp session.
 
     Returns:
-        Dict mapping symbol to price.
+        Dict mapping symbol to price (failed symbols are omitted; empty if
+        the request failed).
     """
     if not symbols:
         symbols = (BTCUSDT, ETHUSDT)
 
-    async with aiohttp.ClientSession() as session:
-        tasks = [_fetch_price(session, s) for s in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await get_prices(*symbols, session=own_session)
 
-    prices = {}
-    for symbol, result in zip(symbols, results):
-        if isinstance(result, Decimal):
-            prices[symbol] = result
+    url = f"{BINANCE_API_BASE}/ticker/price"
+    # Binance expects a compact JSON array: symbols=["BTCUSDT","ETHUSDT"]
+    params = {"symbols": json.dumps(list(symbols), separators=(",", ":"))}
 
-    return prices
+    try:
+        async with session.get(url, params=params) as response:
+            if response.status == 200:
+                data = await response.json()
+                return {item["symbol"]: Decimal(item["price"]) for item in data}
+            if response.status != 400:
+                return {}
+    except Exception:
+        return {}
+
+    # One bad symbol fails the batch; fall back to per-symbol requests
+    results = await asyncio.gather(
+        *(_fetch_price(session, s) for s in symbols), return_exceptions=True
+    )
+    return {
+        symbol: result
+        for symbol, result in zip(symbols, results)
+        if isinstance(result, Decimal)
+    }
 
 
 async def _fetch_price(session: aiohttp.ClientSession, symbol: str) -> Optional[Decimal]:
@@ -5,10 +5,21 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import cached_property
 from typing import Optional
 
 import aiohttp
 
+# orjson is optional; fall back to stdlib json
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
 from .markets import (
     CryptoPrediction,
     Asset,
@@ -29,8 +40,18 @@ class OrderLevel:
     price: Decimal
     size: Decimal
 
+    @cached_property
+    def price_f(self) -> float:
+        """Price as float, for display and logging."""
+        return float(self.price)
+
+    @cached_property
+    def size_f(self) -> float:
+        """Size as float, for display and logging."""
+        return float(self.size)
+
     def __repr__(self) -> str:
-        return f"({float(self.price):.4f}, {float(self.size):.2f})"
+        return f"({self.price_f:.4f}, {self.size_f:.2f})"
 
 
 @dataclass
@@ -153,7 +174,7 @@ async def fetch_orderbook(
             if response.status != 200:
                 return [], []
 
-            data = await response.json()
+            data = _json_loads(await response.read())
 
             bids = [
                 OrderLevel(
@@ -182,6 +203,7 @@ async def fetch_market_snapshot(
     prediction: Optional[CryptoPrediction] = None,
     asset: Asset = Asset.BTC,
     horizon: MarketHorizon = MarketHorizon.M15,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[MarketSnapshot]:
     """Fetch market snapshot for a prediction market.
 
@@ -191,10 +213,17 @@ async def fetch_market_snapshot(
         prediction: Optional pre-fetched CryptoPrediction.
         asset: Asset type (BTC or ETH).
         horizon: Market horizon (M15, H1, H4).
+        session: Optional shared aiohttp session (reuses pooled connections).
 
     Returns:
         MarketSnapshot or None if not found.
     """
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await fetch_market_snapshot(
+                market_id, spot_price, prediction, asset, horizon, own_session
+            )
+
     # If prediction not provided, fetch it
     if prediction is None:
         # Try to parse market_id as timestamp
@@ -207,16 +236,15 @@ async def fetch_market_snapshot(
                 return None
 
         slug = timestamp_to_slug(asset, horizon, timestamp)
-        prediction = await _fetch_prediction_by_slug(slug, asset, horizon)
+        prediction = await _fetch_prediction_by_slug(slug, asset, horizon, session)
         if prediction is None:
             return None
 
     # Fetch orderbooks for both tokens in parallel
-    async with aiohttp.ClientSession() as session:
-        (yes_bids, yes_asks), (no_bids, no_asks) = await asyncio.gather(
-            fetch_orderbook(session, prediction.up_token_id),
-            fetch_orderbook(session, prediction.down_token_id),
-        )
+    (yes_bids, yes_asks), (no_bids, no_asks) = await asyncio.gather(
+        fetch_orderbook(session, prediction.up_token_id),
+        fetch_orderbook(session, prediction.down_token_id),
+    )
 
     return MarketSnapshot(
         timestamp=time.time(),
@@ -233,6 +261,7 @@ async def fetch_current_snapshot(
     price: Decimal,
     asset: Asset = Asset.BTC,
     horizon: MarketHorizon = MarketHorizon.M15,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[MarketSnapshot]:
     """Fetch snapshot for the current market slot.
 
@@ -240,9 +269,12 @@ async def fetch_current_snapshot(
         price: Current asset price.
         asset: Asset type (BTC or ETH).
         horizon: Market horizon (M15, H1, H4).
+        session: Optional shared aiohttp session (reuses pooled connections).
     """
     timestamp = get_current_slot_timestamp(horizon)
-    return await fetch_market_snapshot(str(timestamp), price, asset=asset, horizon=horizon)
+    return await fetch_market_snapshot(
+        str(timestamp), price, asset=asset, horizon=horizon, session=session
+    )
 
 
 def print_snapshot(snapshot: MarketSnapshot) -> None:
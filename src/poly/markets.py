@@ -344,44 +344,56 @@ def _parse_crypto_event(data: dict, asset: Asset, horizon: MarketHorizon) -> Opt
 
 
 async def _fetch_prediction_by_slug(
-    slug: str, asset: Asset, horizon: MarketHorizon
+    slug: str,
+    asset: Asset,
+    horizon: MarketHorizon,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[CryptoPrediction]:
-    """Fetch a prediction by slug."""
+    """Fetch a prediction by slug.
+
+    Uses the given session if provided, otherwise opens a temporary one.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await _fetch_prediction_by_slug(slug, asset, horizon, own_session)
+
     url = f"{GAMMA_API_BASE}/events?slug={slug}"
 
     # Disable brotli to avoid aiohttp compatibility issues
     headers = {"Accept-Encoding": "gzip, deflate"}
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    return None
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                return None
 
-                data = await response.json()
-                if not data:
-                    return None
+            data = await response.json()
+            if not data:
+                return None
 
-                event = data[0] if isinstance(data, list) else data
-                return _parse_crypto_event(event, asset, horizon)
+            event = data[0] if isinstance(data, list) else data
+            return _parse_crypto_event(event, asset, horizon)
     except Exception:
         return None
 
 
 async def fetch_current_prediction(
-    asset: Asset, horizon: MarketHorizon
+    asset: Asset,
+    horizon: MarketHorizon,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[CryptoPrediction]:
     """Fetch the current prediction market.
 
     Args:
         asset: Crypto asset (BTC or ETH).
         horizon: Market time horizon.
+        session: Optional shared aiohttp session (reuses pooled connections).
 
     Returns:
         CryptoPrediction or None if not found.
     """
     slug = get_slug(asset, horizon)  # slots_ahead=0 by default
-    return await _fetch_prediction_by_slug(slug, asset, horizon)
+    return await _fetch_prediction_by_slug(slug, asset, horizon, session)
 
 
 # ============================================================================
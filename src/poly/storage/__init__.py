@@ -5,10 +5,11 @@ from .db_writer import get_db_writer, DBWriter
 
 # Bigtable is optional (requires google-cloud-bigtable)
 try:
-    from .bigtable import BigtableWriter, BigtableConfig
+    from .bigtable import BigtableWriter, BigtableConfig, decode_orderbook
 except ImportError:
     BigtableWriter = None
     BigtableConfig = None
+    decode_orderbook = None
 
 
 __all__ = [
@@ -17,4 +18,5 @@ __all__ = [
     "DBWriter",
     "BigtableWriter",
     "BigtableConfig",
+    "decode_orderbook",
 ]
@@ -16,6 +16,7 @@ import os
 import struct
 import time
 import uuid
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Union
@@ -49,6 +50,21 @@ CF_DATA = "data"
 # Default TTL (30 days in seconds)
 DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
 
+# zlib level for orderbook cells (level 6 gets most of the gain at low CPU)
+ORDERBOOK_COMPRESS_LEVEL = 6
+
+
+def decode_orderbook(value: bytes) -> str:
+    """Decode an orderbook cell value to its JSON string.
+
+    Handles both zlib-compressed cells and legacy rows stored as plain JSON.
+    """
+    if not value:
+        return ""
+    if value[:1] == b"{":
+        return value.decode("utf-8")
+    return zlib.decompress(value).decode("utf-8")
+
 
 @dataclass
 class BigtableConfig:
@@ -79,6 +95,7 @@ class BigtableWriter:
         project_id: Optional[str] = None,
         instance_id: Optional[str] = None,
         config: Optional[BigtableConfig] = None,
+        compress_orderbook: bool = True,
     ):
         """Initialize Bigtable writer.
 
@@ -86,6 +103,7 @@ class BigtableWriter:
             project_id: GCP project ID (or use config/env).
             instance_id: Bigtable instance ID (or use config/env).
             config: BigtableConfig object (overrides project_id/instance_id).
+            compress_orderbook: Store orderbook cells zlib-compressed.
         """
         if config:
             self.project_id = config.project_id
@@ -98,6 +116,7 @@ class BigtableWriter:
             self.project_id = cfg.project_id
             self.instance_id = cfg.instance_id
 
+        self.compress_orderbook = compress_orderbook
         self._client: Optional[bigtable.Client] = None
         self._instance: Optional[bigtable.Instance] = None
         self._tables: dict = {}
@@ -221,6 +240,10 @@ class BigtableWriter:
         Stores only non-derivable data:
         - timestamp, market_id, spot_price, orderbook
 
+        The orderbook cell is zlib-compressed unless compress_orderbook is
+        disabled; spot_price stays in its own cell so price-only readers
+        never need to decompress it.
+
         Args:
             market_id: Market identifier/slug.
             spot_price: Asset spot price at snapshot time.
@@ -230,16 +253,41 @@ class BigtableWriter:
         """
         ts = ts or time.time()
         table = self._get_table(table_name)
+        self._snapshot_row(table, market_id, spot_price, orderbook_json, ts).commit()
 
+    def _snapshot_row(
+        self,
+        table,
+        market_id: str,
+        spot_price: float,
+        orderbook_json: str,
+        ts: float,
+    ):
+        """Build (but don't commit) the DirectRow for a snapshot."""
         # Row key: inverted_timestamp#market_id (for reverse chronological order)
         row_key = self._ts_to_bytes(ts) + b"#" + market_id.encode("utf-8")
 
+        orderbook_value = self._encode_value(orderbook_json)
+        if self.compress_orderbook:
+            orderbook_value = zlib.compress(orderbook_value, ORDERBOOK_COMPRESS_LEVEL)
+
         row = table.direct_row(row_key)
         row.set_cell(CF_DATA, b"ts", self._encode_value(ts))
         row.set_cell(CF_DATA, b"market_id", self._encode_value(market_id))
         row.set_cell(CF_DATA, b"spot_price", self._encode_value(spot_price))
-        row.set_cell(CF_DATA, b"orderbook", self._encode_value(orderbook_json))
-        row.commit()
+        row.set_cell(CF_DATA, b"orderbook", orderbook_value)
+        return row
+
+    @staticmethod
+    def _orderbook_json(snapshot) -> str:
+        """Serialize a MarketSnapshot's orderbook to JSON."""
+        orderbook_data = {
+            "yes_bids": [(float(l.price), float(l.size)) for l in snapshot.yes_bids],
+            "yes_asks": [(float(l.price), float(l.size)) for l in snapshot.yes_asks],
+            "no_bids": [(float(l.price), float(l.size)) for l in snapshot.no_bids],
+            "no_asks": [(float(l.price), float(l.size)) for l in snapshot.no_asks],
+        }
+        return json.dumps(orderbook_data)
 
     def write_snapshot_from_obj(
         self,
@@ -252,21 +300,42 @@ class BigtableWriter:
             snapshot: MarketSnapshot object (contains spot_price).
             table_name: Bigtable table name.
         """
-        orderbook_data = {
-            "yes_bids": [(float(l.price), float(l.size)) for l in snapshot.yes_bids],
-            "yes_asks": [(float(l.price), float(l.size)) for l in snapshot.yes_asks],
-            "no_bids": [(float(l.price), float(l.size)) for l in snapshot.no_bids],
-            "no_asks": [(float(l.price), float(l.size)) for l in snapshot.no_asks],
-        }
-
         self.write_snapshot(
             market_id=snapshot.market_id,
             spot_price=float(snapshot.spot_price),
-            orderbook_json=json.dumps(orderbook_data),
+            orderbook_json=self._orderbook_json(snapshot),
             ts=snapshot.timestamp,
             table_name=table_name,
         )
 
+    def write_snapshots_from_objs(self, items: list[tuple]) -> None:
+        """Write several MarketSnapshot objects with one mutate_rows per table.
+
+        Args:
+            items: List of (snapshot, table_name) tuples.
+
+        Raises:
+            RuntimeError: If any row in the batch failed to write.
+        """
+        rows_by_table: dict[str, list] = {}
+        for snapshot, table_name in items:
+            row = self._snapshot_row(
+                self._get_table(table_name),
+                market_id=snapshot.market_id,
+                spot_price=float(snapshot.spot_price),
+                orderbook_json=self._orderbook_json(snapshot),
+                ts=snapshot.timestamp,
+            )
+            rows_by_table.setdefault(table_name, []).append(row)
+
+        failed = 0
+        for table_name, rows in rows_by_table.items():
+            statuses = self._get_table(table_name).mutate_rows(rows)
+            failed += sum(1 for status in statuses if status.code != 0)
+
+        if failed:
+            raise RuntimeError(f"{failed} of {len(items)} snapshot writes failed")
+
     # --- Opportunities ---
 
     def write_opportunity(
@@ -371,11 +440,11 @@ class BigtableWriter:
         """
         table = self._get_table(table_name)
 
+        # orderbook may be compressed, so it is decoded separately
         columns = {
             "ts": float,
             "market_id": str,
             "spot_price": float,
-            "orderbook": str,
         }
 
         # Build row key range for time filtering
@@ -399,6 +468,11 @@ class BigtableWriter:
             if market_id and data.get("market_id") != market_id:
                 continue
 
+            orderbook_cells = row.cells.get(CF_DATA, {}).get(b"orderbook")
+            data["orderbook"] = None
+            if orderbook_cells and orderbook_cells[0].value:
+                data["orderbook"] = decode_orderbook(orderbook_cells[0].value)
+
             results.append(data)
 
             if len(results) >= limit:
@@ -0,0 +1,97 @@
+"""Tests for Bigtable orderbook cell encoding."""
+
+import json
+import zlib
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from poly.storage.bigtable import BigtableWriter, decode_orderbook
+
+
+def level(price: str, size: str) -> SimpleNamespace:
+    """Create an orderbook level."""
+    return SimpleNamespace(price=Decimal(price), size=Decimal(size))
+
+
+def make_snapshot():
+    """Create a minimal MarketSnapshot-like object."""
+    return SimpleNamespace(
+        market_id="btc-updown-15m-1700000000",
+        spot_price=Decimal("43250.5"),
+        timestamp=1700000000.25,
+        yes_bids=[level("0.52", "100"), level("0.51", "250.5")],
+        yes_asks=[level("0.54", "80")],
+        no_bids=[level("0.46", "80")],
+        no_asks=[level("0.48", "100"), level("0.49", "10")],
+    )
+
+
+def build_cells(writer: BigtableWriter, snapshot) -> dict[bytes, bytes]:
+    """Build a snapshot row and return its cells as {qualifier: value}."""
+    table = MagicMock()
+    row = writer._snapshot_row(
+        table,
+        market_id=snapshot.market_id,
+        spot_price=float(snapshot.spot_price),
+        orderbook_json=writer._orderbook_json(snapshot),
+        ts=snapshot.timestamp,
+    )
+    assert row is table.direct_row.return_value
+    return {call.args[1]: call.args[2] for call in row.set_cell.call_args_list}
+
+
+@pytest.fixture
+def snapshot():
+    """Create a snapshot fixture."""
+    return make_snapshot()
+
+
+class TestOrderbookEncoding:
+    """Tests for orderbook cell compression and decoding."""
+
+    def test_compressed_round_trip(self, snapshot):
+        """Test compressed orderbook cells decode to the original JSON."""
+        writer = BigtableWriter(project_id="p", instance_id="i")
+        cells = build_cells(writer, snapshot)
+
+        stored = cells[b"orderbook"]
+        assert stored[:1] != b"{"
+        assert decode_orderbook(stored) == writer._orderbook_json(snapshot)
+
+        ob = json.loads(decode_orderbook(stored))
+        assert ob["yes_bids"] == [[0.52, 100.0], [0.51, 250.5]]
+        assert ob["no_asks"] == [[0.48, 100.0], [0.49, 10.0]]
+
+    def test_uncompressed_path(self, snapshot):
+        """Test compress_orderbook=False stores plain JSON that still decodes."""
+        writer = BigtableWriter(project_id="p", instance_id="i", compress_orderbook=False)
+        cells = build_cells(writer, snapshot)
+
+        stored = cells[b"orderbook"]
+        assert stored == writer._orderbook_json(snapshot).encode("utf-8")
+        assert decode_orderbook(stored) == writer._orderbook_json(snapshot)
+
+    def test_other_cells_not_compressed(self, snapshot):
+        """Test spot_price and market_id stay readable without decompression."""
+        writer = BigtableWriter(project_id="p", instance_id="i")
+        cells = build_cells(writer, snapshot)
+
+        assert cells[b"market_id"] == snapshot.market_id.encode("utf-8")
+        assert float(cells[b"spot_price"]) == 43250.5
+
+    def test_legacy_plain_json(self):
+        """Test legacy rows stored as plain JSON are returned unchanged."""
+        legacy = '{"yes_bids": [[0.5, 10.0]], "yes_asks": [], "no_bids": [], "no_asks": []}'
+        assert decode_orderbook(legacy.encode("utf-8")) == legacy
+
+    def test_compressed_bytes(self):
+        """Test raw zlib-compressed JSON decodes."""
+        payload = '{"yes_bids": [], "yes_asks": [[0.6, 5.0]], "no_bids": [], "no_asks": []}'
+        assert decode_orderbook(zlib.compress(payload.encode("utf-8"))) == payload
+
+    def test_empty_value(self):
+        """Test empty cells decode to an empty string."""
+        assert decode_orderbook(b"") == ""
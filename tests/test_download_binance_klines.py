@@ -0,0 +1,128 @@
+"""Tests for kline gap detection and missing-date planning."""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Scripts are not a package; import the downloader module directly
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from download_binance_klines import KlineDownloader, MICROSECOND_THRESHOLD
+
+MINUTE_MS = 60 * 1000
+
+# 2024-01-01 00:00:00 UTC in milliseconds
+BASE_MS = 1_704_067_200_000
+
+
+def kline(open_time: int, symbol: str = "BTCUSDT") -> tuple:
+    """Create a kline row in klines column order."""
+    return (symbol, "1m", open_time, 1.0, 1.0, 1.0, 1.0, 1.0, open_time, 1.0, 1, 1.0, 1.0)
+
+
+def utc(ms: int) -> datetime:
+    """Convert a millisecond timestamp to a UTC datetime."""
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+def today_midnight() -> datetime:
+    """Current UTC date at midnight."""
+    now = datetime.now(timezone.utc)
+    return datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    """Create a downloader backed by a temporary database."""
+    dl = KlineDownloader(db_path=tmp_path / "klines.db")
+    yield dl
+    dl.close()
+
+
+class TestFindGaps:
+    """Tests for KlineDownloader.find_gaps."""
+
+    def test_empty_database(self, downloader):
+        """Test no gaps are reported without data."""
+        assert downloader.find_gaps() == []
+
+    def test_contiguous(self, downloader):
+        """Test contiguous klines have no gaps."""
+        downloader.store_records([kline(BASE_MS + i * MINUTE_MS) for i in range(10)])
+        assert downloader.find_gaps() == []
+
+    def test_gaps(self, downloader):
+        """Test each gap spans from the expected next kline to the next one present."""
+        minutes = [0, 1, 2, 5, 6, 10]
+        downloader.store_records([kline(BASE_MS + m * MINUTE_MS) for m in minutes])
+
+        assert downloader.find_gaps() == [
+            (utc(BASE_MS + 3 * MINUTE_MS), utc(BASE_MS + 5 * MINUTE_MS)),
+            (utc(BASE_MS + 7 * MINUTE_MS), utc(BASE_MS + 10 * MINUTE_MS)),
+        ]
+
+    def test_mixed_units(self, downloader):
+        """Test millisecond and microsecond timestamps are compared on one scale."""
+        ms_rows = [kline(BASE_MS + i * MINUTE_MS) for i in range(3)]
+        # Minute 3 continues in microseconds; minute 4 is missing
+        us_rows = [kline((BASE_MS + m * MINUTE_MS) * 1000) for m in (3, 5)]
+        assert us_rows[0][2] > MICROSECOND_THRESHOLD
+        downloader.store_records(ms_rows + us_rows)
+
+        assert downloader.find_gaps() == [
+            (utc(BASE_MS + 4 * MINUTE_MS), utc(BASE_MS + 5 * MINUTE_MS)),
+        ]
+
+    def test_other_symbols_ignored(self, downloader):
+        """Test rows for other symbols don't fill or create gaps."""
+        downloader.store_records([
+            kline(BASE_MS),
+            kline(BASE_MS + 2 * MINUTE_MS),
+            kline(BASE_MS + MINUTE_MS, symbol="ETHUSDT"),
+        ])
+
+        assert downloader.find_gaps() == [
+            (utc(BASE_MS + MINUTE_MS), utc(BASE_MS + 2 * MINUTE_MS)),
+        ]
+
+
+class TestGetMissingDates:
+    """Tests for KlineDownloader.get_missing_dates."""
+
+    def test_empty_database(self, downloader):
+        """Test every day up to yesterday is missing without data."""
+        today = today_midnight()
+        expected = [today - timedelta(days=d) for d in range(5, 0, -1)]
+        assert downloader.get_missing_dates(5) == expected
+
+    def test_older_and_newer(self, downloader):
+        """Test days before the oldest and after the newest row are missing."""
+        today = today_midnight()
+        oldest = today - timedelta(days=7, hours=-3)
+        newest = today - timedelta(days=4, hours=-12)
+
+        missing = downloader.get_missing_dates(10, time_range=(oldest, newest))
+
+        assert missing == [
+            today - timedelta(days=d) for d in (10, 9, 8, 3, 2, 1)
+        ]
+
+    def test_up_to_date(self, downloader):
+        """Test nothing is missing when data covers the target through yesterday."""
+        today = today_midnight()
+        time_range = (today - timedelta(days=30), today - timedelta(minutes=1))
+        assert downloader.get_missing_dates(10, time_range=time_range) == []
+
+    def test_queries_time_range(self, downloader):
+        """Test the stored time range is used when none is passed."""
+        today = today_midnight()
+        start_ms = int((today - timedelta(days=2)).timestamp() * 1000)
+        downloader.store_records([kline(start_ms + i * MINUTE_MS) for i in range(3)])
+
+        assert downloader.get_missing_dates(4) == [
+            today - timedelta(days=4),
+            today - timedelta(days=3),
+            today - timedelta(days=1),
+        ]
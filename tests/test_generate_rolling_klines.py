@@ -0,0 +1,234 @@
+"""Tests for rolling N-minute kline aggregation."""
+
+import random
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Scripts are not a package; import the generator module directly
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import generate_rolling_klines as grk
+from generate_rolling_klines import OUTPUT_COLUMNS
+
+np = pytest.importorskip("numpy")
+
+MINUTE_MS = 60 * 1000
+
+# 2024-01-01 00:00:00 UTC in milliseconds
+BASE_MS = 1_704_067_200_000
+
+
+def make_klines(n: int, seed: int = 7) -> dict[str, list]:
+    """Create n random 1-minute klines as one list per column."""
+    rng = random.Random(seed)
+    klines = {col: [] for col in OUTPUT_COLUMNS}
+    price = 40_000.0
+    for i in range(n):
+        open_ = price
+        close = open_ + rng.uniform(-50, 50)
+        klines["open_time"].append(BASE_MS + i * MINUTE_MS)
+        klines["open"].append(open_)
+        klines["high"].append(max(open_, close) + rng.uniform(0, 20))
+        klines["low"].append(min(open_, close) - rng.uniform(0, 20))
+        klines["close"].append(close)
+        klines["volume"].append(rng.uniform(0, 5) * 10 ** rng.randint(-3, 3))
+        klines["close_time"].append(BASE_MS + (i + 1) * MINUTE_MS - 1)
+        klines["trades"].append(rng.randint(0, 500))
+        price = close
+    # Repeated extremes exercise the deque tie handling
+    if n >= 24:
+        klines["high"][10:14] = [klines["high"][10]] * 4
+        klines["low"][20:24] = [klines["low"][20]] * 4
+    return klines
+
+
+def reference(klines: dict[str, list], window: int) -> dict[str, list]:
+    """Aggregate windows directly from the documented rules."""
+    n = len(klines["open"])
+    out = {col: [] for col in OUTPUT_COLUMNS}
+    for i in range(n - window + 1):
+        j = i + window
+        out["open_time"].append(klines["open_time"][i])
+        out["open"].append(klines["open"][i])
+        out["high"].append(max(klines["high"][i:j]))
+        out["low"].append(min(klines["low"][i:j]))
+        out["close"].append(klines["close"][j - 1])
+        out["volume"].append(sum(klines["volume"][i:j]))
+        out["close_time"].append(klines["close_time"][j - 1])
+        out["trades"].append(sum(klines["trades"][i:j]))
+    return out
+
+
+def to_arrays(klines: dict[str, list]) -> dict:
+    """Convert list columns to the arrays _load_klines produces."""
+    return {
+        col: np.asarray(values, dtype=np.int64 if col in grk.INT_COLUMNS else np.float64)
+        for col, values in klines.items()
+    }
+
+
+def assert_matches(result: dict, expected: dict[str, list], volume_abs: float = 1e-12):
+    """Assert aggregated columns equal the reference (volume within rounding).
+
+    SQLite's framed sum() adds and subtracts as the frame slides, so its
+    volumes carry absolute rounding error on the scale of the largest
+    volume in the series; the SQL checks pass a wider ``volume_abs``.
+    """
+    for col in OUTPUT_COLUMNS:
+        got = list(result[col])
+        if col == "volume":
+            assert got == pytest.approx(expected[col], rel=1e-12, abs=volume_abs), col
+        else:
+            assert got == expected[col], col
+
+
+def write_input_db(path: Path, klines: dict[str, list], symbol: str = "BTCUSDT"):
+    """Write 1-minute klines to a database laid out like binance_klines.db."""
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        """
+        CREATE TABLE klines (
+            symbol TEXT NOT NULL,
+            interval TEXT NOT NULL,
+            open_time INTEGER NOT NULL,
+            open REAL NOT NULL,
+            high REAL NOT NULL,
+            low REAL NOT NULL,
+            close REAL NOT NULL,
+            volume REAL NOT NULL,
+            close_time INTEGER NOT NULL,
+            trades INTEGER NOT NULL,
+            PRIMARY KEY (symbol, interval, open_time)
+        )
+        """
+    )
+    rows = zip(*(klines[col] for col in OUTPUT_COLUMNS))
+    conn.executemany(
+        f"INSERT INTO klines (symbol, interval, {', '.join(OUTPUT_COLUMNS)}) "
+        f"VALUES (?, '1m', {', '.join('?' * len(OUTPUT_COLUMNS))})",
+        ((symbol, *row) for row in rows),
+    )
+    conn.commit()
+    conn.close()
+
+
+def read_output(path: Path, window: int, symbol: str = "BTCUSDT") -> dict[str, list]:
+    """Read generated N-minute klines back as one list per column."""
+    conn = sqlite3.connect(str(path))
+    rows = conn.execute(
+        f"SELECT {', '.join(OUTPUT_COLUMNS)} FROM klines_{window}min "
+        "WHERE symbol = ? ORDER BY open_time",
+        (symbol,),
+    ).fetchall()
+    conn.close()
+    columns = zip(*rows) if rows else [()] * len(OUTPUT_COLUMNS)
+    return {col: list(values) for col, values in zip(OUTPUT_COLUMNS, columns)}
+
+
+@pytest.fixture
+def klines():
+    """Create 1-minute klines fixture."""
+    return make_klines(300)
+
+
+class TestRollingExtrema:
+    """Tests for the monotonic-deque kernel."""
+
+    @pytest.mark.parametrize("window", [1, 2, 5, 60])
+    def test_matches_brute_force(self, klines, window):
+        """Test rolling highs/lows equal per-window max/min."""
+        expected = reference(klines, window)
+        arrays = to_arrays(klines)
+        kernel = getattr(grk._rolling_extrema, "py_func", grk._rolling_extrema)
+
+        high, low = kernel(arrays["high"], arrays["low"], window)
+
+        assert high.tolist() == expected["high"]
+        assert low.tolist() == expected["low"]
+
+
+class TestAggregateKlines:
+    """Tests for the NumPy and pure-Python aggregators."""
+
+    @pytest.mark.parametrize("window", [1, 3, 15])
+    @pytest.mark.parametrize("use_kernel", [True, False])
+    def test_numpy(self, klines, window, use_kernel, monkeypatch):
+        """Test the NumPy aggregator with and without the extrema kernel."""
+        if not use_kernel:
+            monkeypatch.setattr(grk, "njit", None)
+        elif grk.njit is None:
+            # Take the kernel branch with the uncompiled function
+            monkeypatch.setattr(grk, "njit", object())
+
+        result = grk._aggregate_klines_numpy(to_arrays(klines), window)
+
+        assert_matches(result, reference(klines, window))
+
+    @pytest.mark.parametrize("window", [1, 3, 15])
+    def test_python(self, klines, window):
+        """Test the pure-Python aggregator."""
+        result = grk._aggregate_klines_py(klines, window)
+
+        assert_matches(result, reference(klines, window))
+
+    def test_trades_stay_integer(self, klines):
+        """Test trade sums are exact integers on both paths."""
+        numpy_trades = grk._aggregate_klines_numpy(to_arrays(klines), 5)["trades"]
+        py_trades = grk._aggregate_klines_py(klines, 5)["trades"]
+
+        assert numpy_trades.dtype == np.int64
+        assert all(isinstance(t, int) for t in py_trades)
+
+    def test_fewer_rows_than_window(self):
+        """Test too few klines yield empty columns."""
+        short = make_klines(4)
+
+        numpy_result = grk._aggregate_klines_numpy(to_arrays(short), 5)
+        py_result = grk._aggregate_klines_py(short, 5)
+
+        assert all(len(numpy_result[col]) == 0 for col in OUTPUT_COLUMNS)
+        assert py_result == {col: [] for col in OUTPUT_COLUMNS}
+
+
+class TestGenerateRollingKlines:
+    """Tests for the database-backed generators."""
+
+    @pytest.mark.parametrize("window", [3, 15])
+    def test_python_and_sql_match(self, tmp_path, klines, window):
+        """Test the in-Python and SQLite window-function generators agree."""
+        input_db = tmp_path / "klines.db"
+        write_input_db(input_db, klines)
+        expected = reference(klines, window)
+
+        py_db = tmp_path / "py.db"
+        sql_db = tmp_path / "sql.db"
+        assert grk.generate_rolling_klines(input_db, py_db, window=window) == (
+            len(klines["open"]), len(expected["open"])
+        )
+        assert grk.generate_rolling_klines_sql(input_db, sql_db, window=window) == (
+            len(klines["open"]), len(expected["open"])
+        )
+
+        assert_matches(read_output(py_db, window), expected)
+        assert_matches(read_output(sql_db, window), expected, volume_abs=1e-9)
+
+    def test_other_symbols_ignored(self, tmp_path, klines):
+        """Test only the requested symbol is aggregated."""
+        input_db = tmp_path / "klines.db"
+        write_input_db(input_db, klines)
+        conn = sqlite3.connect(str(input_db))
+        conn.execute(
+            "INSERT INTO klines VALUES ('ETHUSDT', '1m', ?, 1, 1, 1, 1, 1, ?, 1)",
+            (BASE_MS, BASE_MS + MINUTE_MS - 1),
+        )
+        conn.commit()
+        conn.close()
+
+        output_db = tmp_path / "out.db"
+        grk.generate_rolling_klines_sql(input_db, output_db, window=3)
+
+        assert_matches(read_output(output_db, 3), reference(klines, 3), volume_abs=1e-9)
+        assert read_output(output_db, 3, symbol="ETHUSDT")["open"] == []